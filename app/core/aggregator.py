@@ -4,6 +4,8 @@ import logging
 from datetime import datetime
 import sqlite3
 
+from .records import ArticleRecord
+
 logger = logging.getLogger(__name__)
 
 class ContentAggregator:
@@ -21,28 +23,34 @@ class ContentAggregator:
         articles = []
         
         for feed_url in self.feeds:
-            try:
-                logger.info(f"Fetching from {feed_url}")
-                feed = feedparser.parse(feed_url)
-                
-                # Get latest N articles from each feed
-                for entry in feed.entries[:self.articles_per_feed]:
-                    article = {
-                        'title': entry.get('title', '').strip(),
-                        'content': entry.get('summary', '').strip(),
-                        'url': entry.get('link', ''),
-                        'source': feed_url,
-                        'published_date': entry.get('published', '')
-                    }
-                    articles.append(article)
-                    
-            except Exception as e:
-                logger.error(f"Error fetching from {feed_url}: {str(e)}")
-                continue
+            articles.extend(self.fetch_feed(feed_url))
                 
         logger.info(f"Fetched {len(articles)} articles")
         return articles
 
+    def fetch_feed(self, feed_url):
+        """Fetch latest articles from a single feed"""
+        articles = []
+        try:
+            logger.info(f"Fetching from {feed_url}")
+            feed = feedparser.parse(feed_url)
+            
+            # Get latest N articles from each feed
+            for entry in feed.entries[:self.articles_per_feed]:
+                article = ArticleRecord(
+                    title=entry.get('title', '').strip(),
+                    content=entry.get('summary', '').strip(),
+                    url=entry.get('link', ''),
+                    source=feed_url,
+                    published_date=entry.get('published', '')
+                )
+                articles.append(article)
+                
+        except Exception as e:
+            logger.error(f"Error fetching from {feed_url}: {str(e)}")
+            
+        return articles
+
     def _article_exists(self, url):
         """Check if article already exists in database"""
         with sqlite3.connect(self.db.db_path) as conn:
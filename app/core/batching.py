@@ -0,0 +1,117 @@
+# app/core/batching.py
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+class MicroBatcher:
+    """Collects submitted items into batches for a list-in/list-out backend
+
+    A batch is sent when it reaches the current batch size or when the oldest
+    pending item has waited `max_wait` seconds. The batch size adapts to the
+    observed backend latency: it grows by one while requests stay well under
+    `target_latency` and halves when a request exceeds it. Failures do not
+    shrink it on their own: an outage is not a sign that batches are too big,
+    and timeouts already show up as slow requests.
+
+    A failed batch fails every future in it, unless `split(error)` says the
+    error came from the inputs themselves; then the batch is bisected and
+    resent, so one bad input fails only its own future.
+    """
+
+    def __init__(self, backend, max_batch_size=16, min_batch_size=1,
+                 max_wait=0.05, target_latency=2.0, split=None):
+        self.backend = backend
+        self.split = split
+        self.max_batch_size = max_batch_size
+        self.min_batch_size = min_batch_size
+        self.batch_size = min(max(4, min_batch_size), max_batch_size)
+        self.max_wait = max_wait
+        self.target_latency = target_latency
+        self.stats = {'requests': 0, 'items': 0, 'last_latency': None}
+
+        self._pending = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def submit(self, item):
+        """Queue an item and return a Future for its result"""
+        future = Future()
+        self._pending.put((item, future))
+        self._ensure_running()
+        return future
+
+    def map(self, items):
+        """Submit all items and return futures in the same order"""
+        return [self.submit(item) for item in items]
+
+    def _ensure_running(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+                self._thread.start()
+
+    def _collect(self):
+        """Block for the first item, then gather more until size or deadline"""
+        batch = [self._pending.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._pending.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            start = time.perf_counter()
+            error = self._send(batch)
+            self._adapt(time.perf_counter() - start, len(batch), failed=error is not None)
+            if error is not None:
+                logger.error(f"Batch of {len(batch)} failed: {str(error)}")
+                self._fail(batch, error)
+
+    def _send(self, batch):
+        """Call the backend once and resolve the futures; return the error on failure"""
+        items = [item for item, _ in batch]
+        self.stats['requests'] += 1
+        self.stats['items'] += len(items)
+        try:
+            results = self.backend(items)
+            if len(results) != len(items):
+                raise ValueError(f"Backend returned {len(results)} results for {len(items)} inputs")
+        except Exception as e:
+            return e
+
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+        return None
+
+    def _fail(self, batch, error):
+        """Fail the batch, bisecting it first if the error points at its inputs"""
+        if len(batch) == 1 or self.split is None or not self.split(error):
+            for _, future in batch:
+                future.set_exception(error)
+            return
+        mid = len(batch) // 2
+        for half in (batch[:mid], batch[mid:]):
+            half_error = self._send(half)
+            if half_error is not None:
+                self._fail(half, half_error)
+
+    def _adapt(self, latency, size, failed=False):
+        """Additive increase while under the latency target, halve when over"""
+        self.stats['last_latency'] = latency
+
+        if latency > self.target_latency:
+            self.batch_size = max(self.min_batch_size, self.batch_size // 2)
+        elif not failed and size >= self.batch_size and latency < self.target_latency / 2:
+            self.batch_size = min(self.max_batch_size, self.batch_size + 1)
@@ -0,0 +1,218 @@
+# app/core/evaluation.py
+"""Streaming, non-interactive evaluation reports.
+
+Usage:
+    python -m app.core.evaluation summaries [--db knowledge.db]
+    python -m app.core.evaluation grouping [--db knowledge.db] [--fixture tests/fixtures/labeled_articles.jsonl]
+
+Both commands print a JSON report. Rows are streamed in chunks, so memory
+stays bounded regardless of archive size.
+"""
+import argparse
+import json
+import math
+import os
+import sqlite3
+import sys
+import time
+from collections import Counter
+
+from .processor import TOPIC_GROUPS, classify_text, clean_html, lead_summary
+
+DEFAULT_FIXTURE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'tests', 'fixtures', 'labeled_articles.jsonl'
+)
+
+class RunningStats:
+    """Constant-memory mean/stdev/min/max plus histogram-based percentiles"""
+
+    def __init__(self, upper=1.0, bins=100):
+        self.upper = upper
+        self.bins = [0] * bins
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        # Welford's online update
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        # Bin i covers [i, i + 1) * upper / bins; the last one also takes overflow
+        idx = min(int(max(value, 0.0) / self.upper * len(self.bins)), len(self.bins) - 1)
+        self.bins[idx] += 1
+
+    def percentile(self, q):
+        """Upper edge of the histogram bin holding the q-th percentile
+
+        The last bin also holds every value at or above `upper`, so
+        percentiles landing there report the observed maximum.
+        """
+        target, seen = q / 100 * self.count, 0
+        for idx, count in enumerate(self.bins[:-1]):
+            seen += count
+            if seen >= target:
+                edge = (idx + 1) / len(self.bins) * self.upper
+                return min(max(edge, self.min), self.max)
+        return self.max
+
+    def report(self):
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'mean': round(self.mean, 4),
+            'stdev': round(math.sqrt(self._m2 / self.count), 4),
+            'min': round(self.min, 4),
+            'p50': round(self.percentile(50), 4),
+            'p90': round(self.percentile(90), 4),
+            'max': round(self.max, 4)
+        }
+
+def _ngrams(tokens, n):
+    return Counter(tuple(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+
+def rouge_n(candidate, reference, n=1):
+    """ROUGE-N F1 between two texts on lowercased whitespace tokens"""
+    cand, ref = _ngrams(candidate.lower().split(), n), _ngrams(reference.lower().split(), n)
+    overlap = sum((cand & ref).values())
+    if not overlap:
+        return 0.0
+    precision = overlap / sum(cand.values())
+    recall = overlap / sum(ref.values())
+    return 2 * precision * recall / (precision + recall)
+
+def _stream(conn, query, params=(), chunk_size=1000):
+    cursor = conn.execute(query, params)
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        yield from rows
+
+def evaluate_summaries(db_path, chunk_size=1000):
+    """Compression ratio and overlap with a lead-3 baseline for stored summaries"""
+    start = time.perf_counter()
+    compression = RunningStats(upper=2.0)
+    rouge1 = RunningStats()
+    rouge2 = RunningStats()
+    skipped = 0
+
+    with sqlite3.connect(db_path) as conn:
+        for content, summary in _stream(conn, '''
+            SELECT content, summary FROM articles
+            WHERE summary IS NOT NULL AND summary != ''
+        ''', chunk_size=chunk_size):
+            clean_content = clean_html(content or '')
+            if not clean_content:
+                skipped += 1
+                continue
+            baseline = lead_summary(clean_content)
+            compression.add(len(summary.split()) / len(clean_content.split()))
+            rouge1.add(rouge_n(summary, baseline, 1))
+            rouge2.add(rouge_n(summary, baseline, 2))
+
+    elapsed = time.perf_counter() - start
+    return {
+        'report': 'summaries',
+        'articles': compression.count,
+        'skipped_empty_content': skipped,
+        'compression_ratio': compression.report(),
+        'lead3_rouge1_f1': rouge1.report(),
+        'lead3_rouge2_f1': rouge2.report(),
+        'timings': {
+            'elapsed_seconds': round(elapsed, 3),
+            'articles_per_second': round(compression.count / elapsed, 1) if elapsed else None
+        }
+    }
+
+def evaluate_grouping(db_path, fixture_path=DEFAULT_FIXTURE, topic_groups=TOPIC_GROUPS):
+    """Stored topic distribution plus a confusion report on a labeled fixture corpus"""
+    timings = {}
+
+    start = time.perf_counter()
+    with sqlite3.connect(db_path) as conn:
+        distribution = dict(conn.execute('''
+            SELECT COALESCE(topic_group, ''), COUNT(*) FROM articles
+            GROUP BY topic_group ORDER BY topic_group
+        ''').fetchall())
+    timings['distribution_seconds'] = round(time.perf_counter() - start, 3)
+
+    start = time.perf_counter()
+    topics = list(topic_groups)
+    confusion = {label: Counter() for label in topics}
+    total = correct = 0
+    with open(fixture_path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            predicted = classify_text(item['title'], item.get('content'), item.get('summary'), topic_groups)
+            confusion.setdefault(item['label'], Counter())[predicted] += 1
+            total += 1
+            correct += predicted == item['label']
+    timings['classification_seconds'] = round(time.perf_counter() - start, 3)
+
+    per_topic = {}
+    for topic in confusion:
+        true_positive = confusion[topic][topic]
+        predicted_total = sum(row[topic] for row in confusion.values())
+        actual_total = sum(confusion[topic].values())
+        precision = true_positive / predicted_total if predicted_total else 0.0
+        recall = true_positive / actual_total if actual_total else 0.0
+        f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+        per_topic[topic] = {'support': actual_total, 'precision': round(precision, 4),
+                            'recall': round(recall, 4), 'f1': round(f1, 4)}
+
+    return {
+        'report': 'grouping',
+        'archive_distribution': distribution,
+        'fixture': {
+            'path': os.path.relpath(fixture_path),
+            'articles': total,
+            'accuracy': round(correct / total, 4) if total else None,
+            'per_topic': per_topic,
+            'confusion': {label: dict(row) for label, row in confusion.items()}
+        },
+        'timings': timings
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Streaming evaluation reports (JSON on stdout)")
+    parser.add_argument('report', choices=['summaries', 'grouping'])
+    parser.add_argument('--db', default='knowledge.db')
+    parser.add_argument('--fixture', default=DEFAULT_FIXTURE,
+                        help='Labeled JSONL corpus for the grouping confusion report')
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--min-accuracy', type=float, default=None,
+                        help='grouping only: exit with status 1 if fixture accuracy falls below this value')
+    args = parser.parse_args(argv)
+
+    if args.min_accuracy is not None and args.report != 'grouping':
+        parser.error("--min-accuracy only applies to the grouping report")
+
+    if not os.path.exists(args.db):
+        parser.error(f"database not found: {args.db} (run 'python run.py' first)")
+
+    if args.report == 'summaries':
+        result = evaluate_summaries(args.db, args.chunk_size)
+    else:
+        result = evaluate_grouping(args.db, args.fixture)
+
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+    if args.min_accuracy is not None:
+        accuracy = result['fixture']['accuracy']
+        if accuracy is None or accuracy < args.min_accuracy:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+# app/core/ingest.py
+import logging
+import multiprocessing
+import queue
+import time
+
+from .aggregator import ContentAggregator
+from .processor import TOPIC_GROUPS, classify_topic
+from .scheduler import SummaryScheduler
+
+logger = logging.getLogger(__name__)
+
+_SHARD_DONE = None  # Sentinel each worker puts on the queue when it finishes
+
+def shard_feeds(feeds, workers):
+    """Split feed URLs round-robin into at most `workers` non-empty shards"""
+    shards = [feeds[i::workers] for i in range(workers)]
+    return [shard for shard in shards if shard]
+
+def _ingest_shard(feed_urls, articles_per_feed, topic_groups, article_queue):
+    """Worker: parse and classify the articles of a shard of feeds
+
+    Content is passed on as the feed's raw HTML, the same as the in-process
+    path stores it; summarization and evaluation clean it when they read it.
+    """
+    try:
+        aggregator = ContentAggregator()
+        aggregator.articles_per_feed = articles_per_feed
+
+        for feed_url in feed_urls:
+            for article in aggregator.fetch_feed(feed_url):
+                article.topic_group = classify_topic(article, topic_groups)
+                article_queue.put(article)
+    finally:
+        article_queue.put(_SHARD_DONE)
+
+def _write_articles(scheduler, article_queue, producers, batch_size, flush_interval, result_queue):
+    """Writer: the only process that touches SQLite, committing in batches
+
+    Puts ('ok', queued) on `result_queue` when every producer is done, or
+    ('error', message) if saving fails.
+    """
+    try:
+        saved = _drain_articles(scheduler, article_queue, producers, batch_size, flush_interval)
+    except Exception as e:
+        logger.error(f"Ingest writer failed: {str(e)}")
+        result_queue.put(('error', str(e)))
+    else:
+        result_queue.put(('ok', saved))
+
+def _drain_articles(scheduler, article_queue, producers, batch_size, flush_interval):
+    saved = 0
+    pending = []
+    remaining = producers
+
+    while remaining:
+        try:
+            article = article_queue.get(timeout=flush_interval)
+        except queue.Empty:
+            article = False  # Nothing arrived in time, flush what we have
+
+        if article is _SHARD_DONE:
+            remaining -= 1
+        elif article:
+            pending.append(article)
+
+        if pending and (len(pending) >= batch_size or not remaining or article is False):
+            saved += scheduler.enqueue(pending)
+            pending = []
+
+    return saved
+
+def parallel_ingest(database, feeds, workers=None, articles_per_feed=3,
+                    topic_groups=TOPIC_GROUPS, scheduler=None, batch_size=200, flush_interval=1.0):
+    """Ingest feeds with one process per shard and a single SQLite writer process
+
+    The writer queues new articles for summarization through `scheduler`
+    (a SummaryScheduler over `database` by default), the same as the
+    in-process path; summaries are produced later by SummaryScheduler.drain.
+    Returns a dict with the number of queued articles, the worker count and
+    the elapsed wall-clock seconds. Raises RuntimeError if the writer
+    process fails.
+    """
+    scheduler = scheduler or SummaryScheduler(database, topic_groups=topic_groups)
+    workers = workers or multiprocessing.cpu_count()
+    shards = shard_feeds(list(feeds), workers)
+    start = time.perf_counter()
+
+    if not shards:
+        return {'articles': 0, 'workers': 0, 'elapsed': 0.0}
+
+    # Bounded queue so fast workers cannot outrun the writer unboundedly
+    article_queue = multiprocessing.Queue(maxsize=batch_size * 4)
+    result_queue = multiprocessing.Queue()
+
+    writer = multiprocessing.Process(
+        target=_write_articles,
+        args=(scheduler, article_queue, len(shards), batch_size, flush_interval, result_queue),
+        name='ingest-writer'
+    )
+    writer.start()
+
+    processes = [
+        multiprocessing.Process(
+            target=_ingest_shard,
+            args=(shard, articles_per_feed, topic_groups, article_queue),
+            name=f'ingest-worker-{i}'
+        )
+        for i, shard in enumerate(shards)
+    ]
+    for process in processes:
+        process.start()
+
+    try:
+        saved = _wait_for_writer(writer, processes, article_queue, result_queue, flush_interval)
+    except Exception:
+        # Workers may be blocked on the full queue with nothing draining it
+        for process in processes:
+            process.terminate()
+        writer.terminate()
+        raise
+    finally:
+        for process in processes:
+            process.join()
+        writer.join()
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"Ingested {saved} articles with {len(shards)} workers in {elapsed:.2f}s")
+    return {'articles': saved, 'workers': len(shards), 'elapsed': elapsed}
+
+
+def _wait_for_writer(writer, processes, article_queue, result_queue, poll_interval):
+    """Poll for the writer's result while watching for dead processes"""
+    signalled = set()
+    while True:
+        try:
+            status, value = result_queue.get(timeout=poll_interval)
+        except queue.Empty:
+            if not writer.is_alive():
+                raise RuntimeError(f"Ingest writer exited unexpectedly (exit code {writer.exitcode})")
+            # A worker killed by a signal never reached its finally block
+            for process in processes:
+                if process.exitcode is not None and process.exitcode < 0 and process.pid not in signalled:
+                    logger.error(f"{process.name} was killed (exit code {process.exitcode})")
+                    signalled.add(process.pid)
+                    article_queue.put(_SHARD_DONE)
+            continue
+
+        if status == 'error':
+            raise RuntimeError(f"Ingest writer failed: {value}")
+        return value
@@ -1,6 +1,5 @@
 # app/core/processor.py
 from bs4 import BeautifulSoup
-from huggingface_hub import InferenceClient
 from datetime import datetime
 import logging
 import time
@@ -8,61 +7,122 @@ import os
 import requests
 from dotenv import load_dotenv
 
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from .batching import MicroBatcher
+from .resilience import BudgetExhausted, CircuitBreaker, CircuitBreakerOpen, RunBudget
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Keyword taxonomy used for topic classification; 'Tech' is the fallback
+TOPIC_GROUPS = {
+    'AI_ML': ['ai', 'machine learning', 'neural', 'gpt', 'llm', 'artificial intelligence', 'chatgpt', 'openai', 'model', 'deep learning'],
+    'Business': ['startup', 'funding', 'acquisition', 'partnership', 'launch', 'announces', 'market', 'investment'],
+    'Cybersecurity': ['security', 'breach', 'hack', 'privacy', 'vulnerability', 'data', 'cyber', 'protection'],
+    'Innovation': ['research', 'breakthrough', 'innovation', 'development', 'discovery', 'patent', 'scientific', 'future'],
+    'Tech': []  # Default category
+}
+
+def clean_html(content):
+    """Strip HTML tags and normalize whitespace"""
+    text = BeautifulSoup(content, 'html.parser').get_text()
+    return ' '.join(text.split())
+
+def lead_summary(text, sentences=3):
+    """Degraded summary: the first few sentences of the cleaned text"""
+    parts = text.split('. ')
+    lead = '. '.join(parts[:sentences]).strip()
+    if len(parts) > sentences and not lead.endswith('.'):
+        lead += '.'
+    return lead[:600]
+
+def classify_text(title, content, summary, topic_groups=TOPIC_GROUPS):
+    """Return the first topic whose keywords appear in the text, else 'Tech'"""
+    # One lowercase pass; the newlines keep keywords from matching across fields
+    text = f"{title or ''}\n{content or ''}\n{summary or ''}".lower()
+
+    for topic, keywords in topic_groups.items():
+        if topic != 'Tech' and keywords and any(keyword in text for keyword in keywords):
+            return topic
+    return 'Tech'
+
+def classify_topic(article, topic_groups=TOPIC_GROUPS):
+    """Classify an ArticleRecord by its title, content and summary"""
+    return classify_text(article.title, article.content, article.summary, topic_groups)
+
+def is_endpoint_failure(status_code):
+    """Server errors and rate limiting reflect endpoint health; other 4xx reject an input"""
+    return status_code >= 500 or status_code == 429
+
+def is_rejected_input(error):
+    """Whether a request failed because the endpoint refused its inputs"""
+    response = getattr(error, 'response', None)
+    return (isinstance(error, requests.HTTPError) and response is not None
+            and not is_endpoint_failure(response.status_code))
+
+def group_indices_by_topic(articles, topic_groups=TOPIC_GROUPS):
+    """Map each topic to the positions of its articles in `articles`"""
+    groups = {topic: [] for topic in topic_groups}
+    for idx, article in enumerate(articles):
+        groups[classify_topic(article, topic_groups)].append(idx)
+    return groups
+
 class ContentProcessor:
-    def __init__(self):
+    def __init__(self, database=None):
         # Get API token from environment
         self.hf_token = os.getenv('HUGGINGFACE_API_KEY')
         if not self.hf_token:
             raise ValueError("HUGGINGFACE_API_KEY not found in environment variables")
             
-        # Initialize clients
-        self.client = InferenceClient(token=self.hf_token)
         self.summarization_model = "facebook/bart-large-cnn"  # For factual summaries
         self.analysis_model = "gpt2"  # For insights generation (optional)
         self.gemma_url = "https://api-inference.huggingface.co/models/google/gemma-2-2b-it"
+        self.summarization_url = f"https://api-inference.huggingface.co/models/{self.summarization_model}"
         self.headers = {"Authorization": f"Bearer {self.hf_token}"}
         
-        logger.info("Initializing ContentProcessor with Hugging Face Inference API")
+        # Groups concurrent summarization requests into batched API calls;
+        # only batches the endpoint rejected are split to find the bad input
+        self.batcher = MicroBatcher(self.summarize_batch, split=is_rejected_input)
         
-        self.topic_groups = {
-            'AI_ML': ['ai', 'machine learning', 'neural', 'gpt', 'llm', 'artificial intelligence', 'chatgpt', 'openai', 'model', 'deep learning'],
-            'Business': ['startup', 'funding', 'acquisition', 'partnership', 'launch', 'announces', 'market', 'investment'],
-            'Cybersecurity': ['security', 'breach', 'hack', 'privacy', 'vulnerability', 'data', 'cyber', 'protection'],
-            'Innovation': ['research', 'breakthrough', 'innovation', 'development', 'discovery', 'patent', 'scientific', 'future'],
-            'Tech': []  # Default category
+        # Run budget (unbounded unless the caller sets one) and per-endpoint breakers
+        self.budget = RunBudget()
+        self.breakers = {
+            'summarization': CircuitBreaker('summarization', latency_slo=30.0),
+            'insights': CircuitBreaker('insights', latency_slo=20.0)
         }
+        # Last good insights per topic, persisted when a database is given
+        self.database = database
+        self._insights_cache = {}
+        
+        logger.info("Initializing ContentProcessor with Hugging Face Inference API")
 
     def process_article(self, article):
         try:
-            if not article.get('content'):
+            if not article.content:
                 return article, "No content to process"
 
             # Clean HTML tags and normalize spaces
-            clean_content = BeautifulSoup(article['content'], 'html.parser').get_text()
-            clean_content = ' '.join(clean_content.split())
-
-            # Get factual summary using BART
-            summary_response = self.client.summarization(
-                clean_content[:1024],
-                model=self.summarization_model,
-                clean_up_tokenization_spaces=True,
-                truncation="longest_first"
-            )
-            
-            summary = summary_response.get('summary_text', '').strip() if isinstance(summary_response, dict) else str(summary_response).strip()
+            clean_content = clean_html(article.content)
+
+            # Get factual summary using BART; fall back to a lead summary when
+            # out of time or the endpoint is down
+            try:
+                summary = self.summarize_batch([clean_content[:1024]])[0]
+            except (BudgetExhausted, CircuitBreakerOpen):
+                return self._degrade(article, clean_content), None
+            except requests.RequestException as e:
+                if is_rejected_input(e):
+                    raise
+                return self._degrade(article, clean_content), None
 
             # Update article
-            article.update({
-                'summary': summary,
-                'processed_date': datetime.now()
-            })
+            article.summary = summary
+            article.processed_date = datetime.now()
 
-            logger.info(f"Successfully processed article: {article.get('title', 'Unknown')}")
+            logger.info(f"Successfully processed article: {article.title}")
             return article, None
 
         except Exception as e:
@@ -70,19 +130,97 @@ class ContentProcessor:
             logger.error(error_msg)
             return article, error_msg
 
+    def _degrade(self, article, clean_content):
+        """Fill in a lead summary when the summarization endpoint is skipped"""
+        article.summary = lead_summary(clean_content)
+        article.processed_date = datetime.now()
+        article.degraded = True
+        logger.info(f"Using degraded summary for article: {article.title}")
+        return article
+
+    def _post(self, breaker, url, payload, timeout):
+        """POST to an inference endpoint within the run budget and its breaker
+
+        Returns the response and its latency. A timeout that only happened
+        because the budget shortened the call raises BudgetExhausted and is
+        not counted against the breaker.
+        """
+        if self.budget.expired():
+            raise BudgetExhausted(f"run budget spent before calling {breaker.name}")
+        if not breaker.allow_request():
+            raise CircuitBreakerOpen(f"{breaker.name} endpoint unavailable")
+
+        capped = self.budget.timeout(timeout)
+        start = time.perf_counter()
+        try:
+            response = requests.post(url, headers=self.headers, json=payload, timeout=capped)
+        except requests.Timeout:
+            if capped < timeout:
+                breaker.release()
+                raise BudgetExhausted(f"run budget spent waiting for {breaker.name}")
+            breaker.record_failure()
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+        return response, time.perf_counter() - start
+
+    def summarize_batch(self, texts):
+        """Summarize several texts with a single batched inference request"""
+        breaker = self.breakers['summarization']
+        response, latency = self._post(breaker, self.summarization_url, {
+            "inputs": texts,
+            "parameters": {
+                "clean_up_tokenization_spaces": True,
+                "truncation": "longest_first"
+            }
+        }, timeout=60)
+        # A rejected input says nothing about endpoint health
+        if is_endpoint_failure(response.status_code):
+            breaker.record_failure()
+        else:
+            breaker.record_success(latency)
+        response.raise_for_status()
+        return [
+            item.get('summary_text', '').strip() if isinstance(item, dict) else str(item).strip()
+            for item in response.json()
+        ]
+
     def process_batch(self, articles):
         processed = []
         failed = []
         
+        # Submit everything up front so the batcher can group requests
+        pending = []
         for article in articles:
-            processed_article, error = self.process_article(article)
-            if error:
-                failed.append((article, error))
-            else:
-                processed.append(processed_article)
-            
-            # Small delay between articles
-            time.sleep(2)
+            if not article.content:
+                failed.append((article, "No content to process"))
+                continue
+            clean_content = clean_html(article.content)
+            if self.budget.expired() or self.breakers['summarization'].is_open():
+                processed.append(self._degrade(article, clean_content))
+                continue
+            pending.append((article, clean_content, self.batcher.submit(clean_content[:1024])))
+        
+        for article, clean_content, future in pending:
+            try:
+                article.summary = future.result(timeout=self.budget.remaining())
+                article.processed_date = datetime.now()
+                processed.append(article)
+            except (BudgetExhausted, CircuitBreakerOpen, FutureTimeoutError):
+                processed.append(self._degrade(article, clean_content))
+            except requests.RequestException as e:
+                if is_rejected_input(e):
+                    error_msg = f"Error processing article: {str(e)}"
+                    logger.error(error_msg)
+                    failed.append((article, error_msg))
+                else:
+                    # Outages, rate limits and timeouts defer the job instead of failing it
+                    processed.append(self._degrade(article, clean_content))
+            except Exception as e:
+                error_msg = f"Error processing article: {str(e)}"
+                logger.error(error_msg)
+                failed.append((article, error_msg))
         
         logger.info(f"Batch processing completed. Processed: {len(processed)}, Failed: {len(failed)}")
         return processed, failed
@@ -93,8 +231,8 @@ class ContentProcessor:
             # Prepare richer context from articles
             context = []
             for article in articles[:8]:  # Take up to 5 articles for context
-                context.append(f"Title: {article['title']}")
-                context.append(f"Summary: {article.get('summary', 'No summary available')}\n")
+                context.append(f"Title: {article.title}")
+                context.append(f"Summary: {article.summary or 'No summary available'}\n")
             
             context_text = "\n".join(context)
             
@@ -106,10 +244,9 @@ Please provide 3 clear insights about these developments in {topic}. Each insigh
 
             logger.info(f"Generating insights for {topic} with {len(articles)} articles")
             
-            response = requests.post(
-                self.gemma_url,
-                headers=self.headers,
-                json={
+            breaker = self.breakers['insights']
+            try:
+                response, latency = self._post(breaker, self.gemma_url, {
                     "inputs": prompt,
                     "parameters": {
                         "max_length": 300,
@@ -117,10 +254,22 @@ Please provide 3 clear insights about these developments in {topic}. Each insigh
                         "top_p": 0.95,
                         "return_full_text": False
                     }
-                }
-            )
+                }, timeout=30)
+            except (BudgetExhausted, CircuitBreakerOpen) as e:
+                # Fail fast to cached insights when out of time or the endpoint is down
+                logger.info(f"Skipping insights API for {topic} ({str(e)}), using cached insights")
+                return self._cached_insights(topic) or [
+                    f"Key trends emerging in {topic}",
+                    "Industry developments show promising direction",
+                    "Innovation continues to shape the landscape"
+                ]
             
             logger.info(f"Gemma API Response Status: {response.status_code}")
+            # Same rule as summarization: only server errors and 429s trip the breaker
+            if is_endpoint_failure(response.status_code):
+                breaker.record_failure()
+            else:
+                breaker.record_success(latency)
             
             if response.status_code == 200:
                 response_data = response.json()
@@ -146,10 +295,11 @@ Please provide 3 clear insights about these developments in {topic}. Each insigh
                             "Innovation continues to drive industry transformation"
                         ]
                     
+                    self._store_insights(topic, insights[:3])
                     return insights[:3]
                 
             logger.warning(f"Unexpected response format from Gemma API: {response.text}")
-            return [
+            return self._cached_insights(topic) or [
                 f"Significant advances in {topic} technology",
                 "Industry leaders driving innovation",
                 "New applications emerging rapidly"
@@ -157,83 +307,28 @@ Please provide 3 clear insights about these developments in {topic}. Each insigh
             
         except Exception as e:
             logger.error(f"Error generating insights: {str(e)}")
-            return [
+            return self._cached_insights(topic) or [
                 f"Key trends emerging in {topic}",
                 "Industry developments show promising direction",
                 "Innovation continues to shape the landscape"
             ]
 
-    def group_articles_by_topic(self, articles):
-        """Group articles based on their main topics with insights"""
-        groups = {topic: [] for topic in self.topic_groups.keys()}
-        
-        for article in articles:
-            title_lower = article['title'].lower()
-            content_lower = article.get('content', '').lower()
-            summary_lower = article.get('summary', '').lower()
-            
-            # Classify based on keywords
-            classified = False
-            for topic, keywords in self.topic_groups.items():
-                if topic != 'Tech' and keywords and any(
-                    keyword in title_lower or 
-                    keyword in content_lower or 
-                    keyword in summary_lower 
-                    for keyword in keywords):
-                    groups[topic].append(article)
-                    classified = True
-                    break
-            
-            if not classified:
-                groups['Tech'].append(article)
-
-        # Process insights for each group
-        insights = {}
-        for topic, topic_articles in groups.items():
-            if topic_articles:
-                topic_insights = self.get_insights(topic_articles, topic)
-                insights[topic] = {
-                    'count': len(topic_articles),
-                    'sources': list(set(a['source'] for a in topic_articles)),
-                    'insights': topic_insights,
-                    'articles': topic_articles
-                }
-            else:
-                insights[topic] = None
-
+    def _cached_insights(self, topic):
+        """Last good insights for a topic, from memory or the database"""
+        insights = self._insights_cache.get(topic)
+        if insights is None and self.database is not None:
+            try:
+                insights = self.database.get_topic_insights(topic)
+            except Exception as e:
+                logger.error(f"Error loading stored insights: {str(e)}")
+            if insights:
+                self._insights_cache[topic] = insights
         return insights
 
-def group_articles_by_topic(articles):
-    """Group articles based on their main topics"""
-    groups = {
-        'AI_ML': [],
-        'Business': [],
-        'Cybersecurity': [],
-        'Innovation': [],
-        'Tech': []
-    }
-    
-    # Keywords for classification
-    keywords = {
-        'AI_ML': ['ai', 'machine learning', 'neural', 'gpt', 'llm', 'artificial intelligence', 'model'],
-        'Business': ['startup', 'funding', 'acquisition', 'partnership'],
-        'Cybersecurity': ['security', 'breach', 'hack', 'privacy', 'vulnerability'],
-        'Innovation': ['research', 'breakthrough', 'innovation', 'development']
-    }
-    
-    for article in articles:
-        title_lower = article['title'].lower()
-        content_lower = article['content'].lower()
-        
-        # Classify based on keywords
-        classified = False
-        for topic, topic_keywords in keywords.items():
-            if any(keyword in title_lower or keyword in content_lower for keyword in topic_keywords):
-                groups[topic].append(article)
-                classified = True
-                break
-        
-        if not classified:
-            groups['Tech'].append(article)
-    
-    return groups
\ No newline at end of file
+    def _store_insights(self, topic, insights):
+        self._insights_cache[topic] = insights
+        if self.database is not None:
+            try:
+                self.database.save_topic_insights(topic, insights)
+            except Exception as e:
+                logger.error(f"Error saving insights: {str(e)}")
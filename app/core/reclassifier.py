@@ -0,0 +1,144 @@
+# app/core/reclassifier.py
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from datetime import datetime
+
+from .processor import TOPIC_GROUPS, classify_text
+
+logger = logging.getLogger(__name__)
+
+# Case-insensitive substring match of one keyword against the stored text
+_MATCH = "(title LIKE ? ESCAPE '!' OR content LIKE ? ESCAPE '!' OR summary LIKE ? ESCAPE '!')"
+
+def taxonomy_fingerprint(topic_groups):
+    """Stable hash of a taxonomy; topic order matters since the first match wins"""
+    return hashlib.sha256(json.dumps(topic_groups).encode()).hexdigest()
+
+def _like_pattern(keyword):
+    escaped = keyword.replace('!', '!!').replace('%', '!%').replace('_', '!_')
+    return f'%{escaped}%'
+
+def affected_filter(old_groups, new_groups):
+    """SQL condition selecting the articles whose topic may differ under new_groups
+
+    Classification picks the first topic (in order) with a matching keyword,
+    so removing a keyword from a topic can only move articles currently in
+    that topic that contain it, and adding one can only pull in articles that
+    contain it and currently sit in a later topic. Reordering, adding or
+    removing topics affects everything.
+    """
+    old_order = [topic for topic in old_groups if topic != 'Tech']
+    new_order = [topic for topic in new_groups if topic != 'Tech']
+    if old_order != new_order:
+        return '1', []
+
+    clauses, params = [], []
+    for idx, topic in enumerate(new_order):
+        old_keywords, new_keywords = set(old_groups[topic]), set(new_groups[topic])
+
+        for keyword in sorted(old_keywords - new_keywords):
+            clauses.append(f"(topic_group = ? AND {_MATCH})")
+            params += [topic] + [_like_pattern(keyword)] * 3
+
+        later = new_order[idx + 1:] + ['Tech']
+        placeholders = ', '.join('?' * len(later))
+        for keyword in sorted(new_keywords - old_keywords):
+            clauses.append(
+                f"((topic_group IN ({placeholders}) OR topic_group IS NULL OR topic_group = '') AND {_MATCH})"
+            )
+            params += later + [_like_pattern(keyword)] * 3
+
+    return (' OR '.join(clauses) or '0'), params
+
+class Reclassifier:
+    """Keeps stored topic_group values in line with the current taxonomy
+
+    Every fully applied taxonomy is recorded in taxonomy_versions. When it
+    changes, only the articles that could be affected are re-read and
+    reclassified from their stored title, content and summary, in
+    keyset-paginated chunks with one batched UPDATE per chunk. No inference
+    calls are made.
+    """
+
+    def __init__(self, database, chunk_size=5000):
+        self.db = database
+        self.chunk_size = chunk_size
+
+    def current_taxonomy(self):
+        """Latest recorded (version, fingerprint, topic_groups), or Nones"""
+        with sqlite3.connect(self.db.db_name) as conn:
+            row = conn.execute('''
+                SELECT version, fingerprint, topic_groups
+                FROM taxonomy_versions
+                ORDER BY version DESC
+                LIMIT 1
+            ''').fetchone()
+        if not row:
+            return None, None, None
+        return row[0], row[1], json.loads(row[2])
+
+    def sync(self, topic_groups=TOPIC_GROUPS):
+        """Record the taxonomy if it changed and reclassify affected articles"""
+        version, fingerprint, previous = self.current_taxonomy()
+        if fingerprint == taxonomy_fingerprint(topic_groups):
+            return {'version': version, 'candidates': 0, 'updated': 0, 'elapsed': 0.0}
+
+        if previous is None:
+            new_version = self._record(topic_groups)
+            logger.info(f"Recorded initial taxonomy as version {new_version}")
+            return {'version': new_version, 'candidates': 0, 'updated': 0, 'elapsed': 0.0}
+
+        # Record the version only once every affected article is updated, so an
+        # interrupted run is redone from the previous version on the next sync.
+        # Rerunning the same diff is safe: rows already moved no longer match it.
+        where, params = affected_filter(previous, topic_groups)
+        stats = self.reclassify(topic_groups, where, params)
+        new_version = self._record(topic_groups)
+        stats['version'] = new_version
+        logger.info(f"Taxonomy v{version} -> v{new_version}: reclassified {stats['updated']} "
+                    f"of {stats['candidates']} candidate articles in {stats['elapsed']:.2f}s")
+        return stats
+
+    def reclassify(self, topic_groups, where='1', params=()):
+        """Reclassify the articles matching `where`, one chunk per transaction"""
+        start = time.perf_counter()
+        candidates = updated = 0
+        last_id = 0
+
+        with sqlite3.connect(self.db.db_name) as conn:
+            while True:
+                rows = conn.execute(f'''
+                    SELECT id, title, content, summary, topic_group
+                    FROM articles
+                    WHERE id > ? AND ({where})
+                    ORDER BY id
+                    LIMIT ?
+                ''', [last_id, *params, self.chunk_size]).fetchall()
+                if not rows:
+                    break
+                last_id = rows[-1][0]
+                candidates += len(rows)
+
+                changes = []
+                for article_id, title, content, summary, topic in rows:
+                    new_topic = classify_text(title, content, summary, topic_groups)
+                    if new_topic != topic:
+                        changes.append((new_topic, article_id))
+
+                conn.executemany('UPDATE articles SET topic_group = ? WHERE id = ?', changes)
+                conn.commit()
+                updated += len(changes)
+
+        return {'candidates': candidates, 'updated': updated, 'elapsed': time.perf_counter() - start}
+
+    def _record(self, topic_groups):
+        with sqlite3.connect(self.db.db_name) as conn:
+            cursor = conn.execute('''
+                INSERT INTO taxonomy_versions (fingerprint, topic_groups, created_at)
+                VALUES (?, ?, ?)
+            ''', (taxonomy_fingerprint(topic_groups), json.dumps(topic_groups), datetime.now().isoformat()))
+            conn.commit()
+            return cursor.lastrowid
@@ -0,0 +1,50 @@
+# app/core/records.py
+import sys
+
+class ArticleRecord:
+    """Compact, slot-based article used throughout the pipeline
+
+    Source URLs and topic names are interned, so every record from the same
+    feed or topic shares a single string object. Convert with to_dict() /
+    from_dict() only at the persistence and UI boundaries.
+    """
+
+    __slots__ = ('title', 'content', 'url', 'source', 'published_date', 'summary',
+                 'topic_group', 'processed_date', 'weight', 'published_ts', 'attempts', 'degraded')
+
+    def __init__(self, title, content='', url='', source='', published_date='', summary='',
+                 topic_group='', processed_date=None, weight=1.0, published_ts=None,
+                 attempts=0, degraded=False):
+        self.title = title
+        self.content = content
+        self.url = url
+        self.source = sys.intern(source or '')
+        self.published_date = published_date
+        self.summary = summary
+        self.topic_group = sys.intern(topic_group or '')
+        self.processed_date = processed_date
+        self.weight = weight
+        self.published_ts = published_ts
+        self.attempts = attempts
+        self.degraded = degraded
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a database row or feed dict, ignoring unknown keys"""
+        return cls(**{name: data[name] for name in cls.__slots__ if data.get(name) is not None})
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        for name in self.__slots__:
+            setattr(self, name, state.get(name))
+        # Unpickled strings are fresh copies; share the interned ones again
+        self.source = sys.intern(self.source or '')
+        self.topic_group = sys.intern(self.topic_group or '')
+
+    def __repr__(self):
+        return f"ArticleRecord(title={self.title!r}, url={self.url!r}, topic_group={self.topic_group!r})"
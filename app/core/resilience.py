@@ -0,0 +1,115 @@
+# app/core/resilience.py
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class CircuitBreakerOpen(Exception):
+    """Raised instead of calling an endpoint whose breaker is open"""
+
+class BudgetExhausted(Exception):
+    """Raised when the run budget, not the endpoint, cut a call short"""
+
+class RunBudget:
+    """Wall-clock budget for a single pipeline run (None = unbounded)"""
+
+    def __init__(self, seconds=None):
+        self.seconds = seconds
+        self.started = time.monotonic()
+
+    def remaining(self):
+        """Seconds left in the run, or None when unbounded"""
+        if self.seconds is None:
+            return None
+        return max(0.0, self.seconds - (time.monotonic() - self.started))
+
+    def expired(self):
+        return self.remaining() == 0.0
+
+    def timeout(self, default):
+        """Cap a per-call timeout so it never outlives the run"""
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        return max(0.1, min(default, remaining))
+
+class CircuitBreaker:
+    """Per-endpoint breaker: closed -> open -> half_open -> closed
+
+    Opens after `failure_threshold` consecutive failures or latency-SLO
+    violations, fails fast while open, and lets a single probe through once
+    `reset_timeout` seconds have passed. Every transition is logged and kept
+    in `transitions`; `listeners` are called with (name, old, new).
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name, failure_threshold=3, latency_slo=30.0, reset_timeout=60.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.latency_slo = latency_slo
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.transitions = []
+        self.listeners = []
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def is_open(self):
+        """Whether the breaker is currently failing fast (no probe due yet)"""
+        with self._lock:
+            return self.state == self.OPEN and time.monotonic() - self.opened_at < self.reset_timeout
+
+    def allow_request(self):
+        """Whether a call may go to the endpoint right now"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self._transition(self.HALF_OPEN)
+            if self.state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    return False
+                self._probe_in_flight = True
+            return True
+
+    def record_success(self, latency):
+        """Record a completed call; calls slower than the SLO count as failures"""
+        if latency > self.latency_slo:
+            logger.warning(f"{self.name} call took {latency:.1f}s (SLO {self.latency_slo:.1f}s)")
+            self.record_failure()
+            return
+        with self._lock:
+            self._probe_in_flight = False
+            self.consecutive_failures = 0
+            if self.state != self.CLOSED:
+                self._transition(self.CLOSED)
+
+    def release(self):
+        """Give back an allowed call without recording an outcome"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._probe_in_flight = False
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or (
+                    self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold):
+                self.opened_at = time.monotonic()
+                self._transition(self.OPEN)
+
+    def _transition(self, new_state):
+        old_state, self.state = self.state, new_state
+        self.transitions.append((time.time(), old_state, new_state))
+        logger.warning(f"Circuit breaker '{self.name}': {old_state} -> {new_state}")
+        for listener in self.listeners:
+            try:
+                listener(self.name, old_state, new_state)
+            except Exception as e:
+                logger.error(f"Circuit breaker listener failed: {str(e)}")
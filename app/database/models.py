@@ -1,7 +1,8 @@
 # app/database/models.py
+import json
 import sqlite3
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
@@ -23,50 +24,246 @@ class Database:
                     url TEXT UNIQUE,
                     source TEXT,
                     topic_group TEXT,
-                    processed_date TEXT
+                    processed_date TEXT,
+                    summarized_date TEXT
                 )
             ''')
+            # Databases created before summarized_date was split from processed_date
+            columns = {row[1] for row in cursor.execute('PRAGMA table_info(articles)')}
+            if 'summarized_date' not in columns:
+                cursor.execute('ALTER TABLE articles ADD COLUMN summarized_date TEXT')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_articles_topic_date
+                ON articles (topic_group, processed_date)
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS summary_jobs (
+                    url TEXT PRIMARY KEY,
+                    weight REAL,
+                    published_ts REAL,
+                    status TEXT DEFAULT 'pending',
+                    attempts INTEGER DEFAULT 0,
+                    last_error TEXT,
+                    enqueued_at TEXT,
+                    next_attempt_at TEXT
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS taxonomy_versions (
+                    version INTEGER PRIMARY KEY AUTOINCREMENT,
+                    fingerprint TEXT,
+                    topic_groups TEXT,
+                    created_at TEXT
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS topic_insights (
+                    topic TEXT PRIMARY KEY,
+                    insights TEXT,
+                    generated_at TEXT
+                )
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_summary_jobs_status
+                ON summary_jobs (status, next_attempt_at)
+            ''')
             conn.commit()
 
     def save_processed_article(self, article):
         """Save processed article to database"""
+        self.save_processed_articles([article])
+
+    def save_processed_articles(self, articles):
+        """Save a batch of processed articles in a single transaction"""
+        processed_date = datetime.now().isoformat()
         with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
+            conn.executemany('''
                 INSERT OR REPLACE INTO articles 
-                (title, content, summary, url, source, topic_group, processed_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                article['title'],
-                article.get('content', ''),
-                article.get('summary', ''),
-                article['url'],
-                article.get('source', ''),
-                article.get('topic_group', ''),
-                datetime.now().isoformat()
-            ))
+                (title, content, summary, url, source, topic_group, processed_date, summarized_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (
+                    article['title'],
+                    article.get('content', ''),
+                    article.get('summary', ''),
+                    article['url'],
+                    article.get('source', ''),
+                    article.get('topic_group', ''),
+                    processed_date,
+                    processed_date if article.get('summary') else None
+                )
+                for article in articles
+            ])
             conn.commit()
 
-    def get_todays_articles(self):
-        """Get only today's articles"""
+    def _day_range(self, day):
+        """ISO bounds [day, next day) so processed_date comparisons can use the index"""
+        start = datetime.strptime(day, '%Y-%m-%d')
+        return start.strftime('%Y-%m-%d'), (start + timedelta(days=1)).strftime('%Y-%m-%d')
+
+    def get_topic_source_counts(self, day):
+        """Article counts per (topic_group, source) for a day, in one aggregate query"""
+        with sqlite3.connect(self.db_name) as conn:
+            cursor = conn.execute('''
+                SELECT topic_group, source, COUNT(*)
+                FROM articles
+                WHERE processed_date >= ? AND processed_date < ?
+                GROUP BY topic_group, source
+            ''', self._day_range(day))
+            return cursor.fetchall()
+
+    def get_articles_page(self, day, topic, after=None, limit=20):
+        """One page of a topic's articles for a day, newest first
+
+        Keyset pagination on (processed_date, id): pass the last row's
+        (processed_date, id) as `after` to get the next page.
+        """
+        params = [topic, *self._day_range(day)]
+        keyset = ''
+        if after:
+            keyset = 'AND (processed_date < ? OR (processed_date = ? AND id < ?))'
+            params += [after[0], after[0], after[1]]
+
         with sqlite3.connect(self.db_name) as conn:
             conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            today = datetime.now().date().strftime('%Y-%m-%d')
-            
-            cursor.execute('''
+            cursor = conn.execute(f'''
                 SELECT 
+                    id,
                     title,
-                    content,
                     summary,
                     url,
                     source,
                     topic_group,
                     processed_date
                 FROM articles 
-                WHERE DATE(processed_date) = ?
-                ORDER BY processed_date DESC
-            ''', (today,))
-            
-            return [dict(row) for row in cursor.fetchall()]
\ No newline at end of file
+                WHERE topic_group = ? AND processed_date >= ? AND processed_date < ?
+                {keyset}
+                ORDER BY processed_date DESC, id DESC
+                LIMIT ?
+            ''', params + [limit])
+            return [dict(row) for row in cursor.fetchall()]
+
+    def enqueue_articles(self, articles):
+        """Store new articles without a summary and queue a summary job for each
+
+        Articles whose URL is already stored are left untouched. Each article
+        needs 'weight' and 'published_ts' set by the scheduler.
+        """
+        now = datetime.now().isoformat()
+        enqueued = 0
+        with sqlite3.connect(self.db_name) as conn:
+            for article in articles:
+                cursor = conn.execute('''
+                    INSERT OR IGNORE INTO articles 
+                    (title, content, summary, url, source, topic_group, processed_date)
+                    VALUES (?, ?, '', ?, ?, ?, ?)
+                ''', (
+                    article['title'],
+                    article.get('content', ''),
+                    article['url'],
+                    article.get('source', ''),
+                    article.get('topic_group', ''),
+                    now
+                ))
+                if cursor.rowcount:
+                    conn.execute('''
+                        INSERT OR IGNORE INTO summary_jobs
+                        (url, weight, published_ts, enqueued_at, next_attempt_at)
+                        VALUES (?, ?, ?, ?, ?)
+                    ''', (article['url'], article['weight'], article['published_ts'], now, now))
+                    enqueued += 1
+            conn.commit()
+        return enqueued
+
+    def get_summary_jobs(self, limit, half_life_seconds):
+        """Pending jobs that are due, highest priority first
+
+        Priority is the job weight decayed hyperbolically with article age,
+        weight / (1 + age / half_life_seconds): halved at one half-life,
+        a third at two.
+        """
+        now = datetime.now()
+        with sqlite3.connect(self.db_name) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute('''
+                SELECT 
+                    a.title,
+                    a.content,
+                    a.url,
+                    a.source,
+                    a.topic_group,
+                    j.attempts,
+                    j.weight / (1.0 + MAX(0, ? - j.published_ts) / ?) AS priority
+                FROM summary_jobs j
+                JOIN articles a ON a.url = j.url
+                WHERE j.status = 'pending' AND j.next_attempt_at <= ?
+                ORDER BY priority DESC
+                LIMIT ?
+            ''', (now.timestamp(), half_life_seconds, now.isoformat(), limit))
+            return [dict(row) for row in cursor.fetchall()]
+
+    def complete_summary_jobs(self, articles, retry_after=None):
+        """Store summaries and close their jobs
+
+        With `retry_after` (seconds) the summaries are stored but the jobs stay
+        pending, so degraded summaries get replaced in a later run. The
+        summarization time goes to summarized_date; processed_date keeps the
+        ingest time that the digest pages by.
+        """
+        now = datetime.now()
+        with sqlite3.connect(self.db_name) as conn:
+            conn.executemany('''
+                UPDATE articles SET summary = ?, topic_group = ?, summarized_date = ?
+                WHERE url = ?
+            ''', [
+                (article.get('summary', ''), article.get('topic_group', ''), now.isoformat(), article['url'])
+                for article in articles
+            ])
+            if retry_after is None:
+                conn.executemany('''
+                    UPDATE summary_jobs SET status = 'done', last_error = NULL WHERE url = ?
+                ''', [(article['url'],) for article in articles])
+            else:
+                next_attempt = (now + timedelta(seconds=retry_after)).isoformat()
+                conn.executemany('''
+                    UPDATE summary_jobs SET next_attempt_at = ?, last_error = 'degraded' WHERE url = ?
+                ''', [(next_attempt, article['url']) for article in articles])
+            conn.commit()
+
+    def fail_summary_jobs(self, failures, max_attempts, backoff_seconds):
+        """Reschedule failed jobs with exponential backoff, giving up after max_attempts"""
+        now = datetime.now()
+        with sqlite3.connect(self.db_name) as conn:
+            for article, error in failures:
+                attempts = article.get('attempts', 0) + 1
+                next_attempt = now + timedelta(seconds=backoff_seconds * 2 ** (attempts - 1))
+                conn.execute('''
+                    UPDATE summary_jobs
+                    SET attempts = ?, last_error = ?, next_attempt_at = ?,
+                        status = CASE WHEN ? >= ? THEN 'failed' ELSE 'pending' END
+                    WHERE url = ?
+                ''', (attempts, error, next_attempt.isoformat(), attempts, max_attempts, article['url']))
+            conn.commit()
+
+    def save_topic_insights(self, topic, insights):
+        """Keep the latest good insights for a topic"""
+        with sqlite3.connect(self.db_name) as conn:
+            conn.execute('''
+                INSERT OR REPLACE INTO topic_insights (topic, insights, generated_at)
+                VALUES (?, ?, ?)
+            ''', (topic, json.dumps(insights), datetime.now().isoformat()))
+            conn.commit()
+
+    def get_topic_insights(self, topic):
+        """The latest stored insights for a topic, or None"""
+        with sqlite3.connect(self.db_name) as conn:
+            row = conn.execute(
+                'SELECT insights FROM topic_insights WHERE topic = ?', (topic,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count_summary_jobs(self):
+        """Number of summary jobs per status"""
+        with sqlite3.connect(self.db_name) as conn:
+            cursor = conn.execute('SELECT status, COUNT(*) FROM summary_jobs GROUP BY status')
+            return dict(cursor.fetchall())
\ No newline at end of file
@@ -3,6 +3,17 @@ import streamlit as st
 from datetime import datetime
 from database.models import Database
 from core.processor import ContentProcessor
+from core.records import ArticleRecord
+
+PAGE_SIZE = 20
+
+TOPIC_LABELS = {
+   'AI_ML': "AI & ML 🤖",
+   'Business': "Business 💼",
+   'Cybersecurity': "Cybersecurity 🔒",
+   'Innovation': "Innovation 🔬",
+   'Tech': "Tech 💻"
+}
 
 # Page configuration
 st.set_page_config(
@@ -11,91 +22,109 @@ st.set_page_config(
    layout="wide"
 )
 
-# Custom CSS for a cleaner look
-st.markdown("""
-    <style>
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 24px;
-        }
-        .stTabs [data-baseweb="tab"] {
-            height: 50px;
-            white-space: pre-wrap;
-            background-color: transparent;
-            border-radius: 4px;
-            color: #6B7280;
-            font-size: 14px;
-            font-weight: 500;
-            padding: 8px 16px;
-        }
-        .stTabs [aria-selected="true"] {
-            background-color: #EEF2FF;
-            color: #4F46E5;
-        }
-    </style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def get_database():
+   return Database()
+
+@st.cache_resource
+def get_processor():
+   return ContentProcessor(get_database())
+
+@st.cache_data(ttl=300)
+def load_topic_counts(day):
+   """Per-topic article counts and distinct sources from one aggregate query"""
+   counts = {topic: 0 for topic in TOPIC_LABELS}
+   sources = set()
+   for topic, source, count in get_database().get_topic_source_counts(day):
+       # Rows without a known topic have no tab, so they are not counted either
+       if topic not in counts:
+           continue
+       counts[topic] += count
+       sources.add(source)
+   return counts, len(sources)
+
+@st.cache_data(ttl=300)
+def load_page(day, topic, after):
+   """One page of articles, plus one extra row to tell if there is a next page"""
+   rows = get_database().get_articles_page(day, topic, after, PAGE_SIZE + 1)
+   return rows[:PAGE_SIZE], len(rows) > PAGE_SIZE
+
+@st.cache_data(ttl=3600)
+def load_insights(day, topic):
+   """Insights from the topic's most recent articles"""
+   rows, _ = load_page(day, topic, None)
+   return get_processor().get_insights([ArticleRecord.from_dict(row) for row in rows[:8]], topic)
 
 def main():
-   # Initialize components
-   db = Database()
-   processor = ContentProcessor()
+   day = datetime.now().strftime('%Y-%m-%d')
    
    # Header
    st.title("🗞️ Daily Tech Digest")
    st.subheader(f"Today's Tech News Summary - {datetime.now().strftime('%B %d, %Y')}")
    
-   # Get today's articles
-   articles = db.get_todays_articles()
-   if not articles:
+   counts, source_count = load_topic_counts(day)
+   total = sum(counts.values())
+   if not total:
        st.info("Today's digest is being prepared. Please check back later.")
        return
-       
-   grouped_insights = processor.group_articles_by_topic(articles)
    
    # Stats row
    col1, col2, col3 = st.columns(3)
    with col1:
-       st.metric("Articles", len(articles))
+       st.metric("Articles", total)
    with col2:
-       st.metric("Sources", len(set(a['source'] for a in articles)))
+       st.metric("Sources", source_count)
    with col3:
-       st.metric("Topics", len([g for g in grouped_insights.values() if g]))
+       st.metric("Topics", len([c for c in counts.values() if c]))
    
-   # Create tabs for different categories
-   tabs = st.tabs([
-       f"AI & ML 🤖 ({len(grouped_insights['AI_ML']['articles']) if grouped_insights['AI_ML'] else 0})",
-       f"Business 💼 ({len(grouped_insights['Business']['articles']) if grouped_insights['Business'] else 0})",
-       f"Cybersecurity 🔒 ({len(grouped_insights['Cybersecurity']['articles']) if grouped_insights['Cybersecurity'] else 0})",
-       f"Innovation 🔬 ({len(grouped_insights['Innovation']['articles']) if grouped_insights['Innovation'] else 0})",
-       f"Tech 💻 ({len(grouped_insights['Tech']['articles']) if grouped_insights['Tech'] else 0})"
-   ])
+   # Only the selected topic is queried and rendered
+   topic = st.radio(
+       "Topic",
+       list(TOPIC_LABELS),
+       format_func=lambda t: f"{TOPIC_LABELS[t]} ({counts.get(t, 0)})",
+       horizontal=True,
+       label_visibility="collapsed"
+   )
    
-   # Display articles in each tab
-   for tab, (topic, insight) in zip(tabs, grouped_insights.items()):
-       with tab:
-           if insight:
-               # Show topic insights
-               st.markdown("### 🔍 Key Insights")
-               if 'insights' in insight and insight['insights']:
-                   for idx, insight_text in enumerate(insight['insights'], 1):
-                       st.markdown(f"{idx}. {insight_text}")
-               else:
-                   st.markdown("No insights available for this topic.")
+   if not counts.get(topic):
+       st.info(f"No {topic} articles today.")
+   else:
+       # Show topic insights
+       st.markdown("### 🔍 Key Insights")
+       insights = load_insights(day, topic)
+       if insights:
+           for idx, insight_text in enumerate(insights, 1):
+               st.markdown(f"{idx}. {insight_text}")
+       else:
+           st.markdown("No insights available for this topic.")
+       
+       # Keyset cursors of the pages visited so far, per topic
+       cursors = st.session_state.setdefault('cursors', {}).setdefault((day, topic), [None])
+       articles, has_next = load_page(day, topic, cursors[-1])
+       
+       st.markdown(f"### 📰 Articles (page {len(cursors)} of {-(-counts[topic] // PAGE_SIZE)})")
+       for article in articles:
+           with st.expander(f"📰 {article['title']}", expanded=False):
+               st.markdown(f"**Summary:**")
+               st.write(article['summary'] or "Summary pending.")
                
-               st.markdown("### 📰 Articles")
-               for article in insight['articles']:
-                   with st.expander(f"📰 {article['title']}", expanded=False):
-                       st.markdown(f"**Summary:**")
-                       st.write(article['summary'])
-                       
-                       col1, col2 = st.columns([3,1])
-                       with col1:
-                           st.caption(f"Source: {article['source']}")
-                       with col2:
-                           st.markdown(f"[Read More →]({article['url']})")
-                       
-                       st.divider()
-           else:
-               st.info(f"No {topic} articles today.")
+               col1, col2 = st.columns([3,1])
+               with col1:
+                   st.caption(f"Source: {article['source']}")
+               with col2:
+                   st.markdown(f"[Read More →]({article['url']})")
+               
+               st.divider()
+       
+       col1, _, col2 = st.columns([1,4,1])
+       with col1:
+           if st.button("← Newer", disabled=len(cursors) == 1):
+               cursors.pop()
+               st.rerun()
+       with col2:
+           if st.button("Older →", disabled=not has_next):
+               cursors.append((articles[-1]['processed_date'], articles[-1]['id']))
+               st.rerun()
 
    # Footer
    st.markdown("---")
@@ -0,0 +1,107 @@
+# benchmarks/article_records.py
+"""Per-article memory and grouping time: free-form dicts vs ArticleRecord.
+
+Usage: python -m benchmarks.article_records [--articles 1000000]
+"""
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+from app.core.processor import TOPIC_GROUPS, group_indices_by_topic
+from app.core.records import ArticleRecord
+
+FEEDS = [
+    'https://techcrunch.com/feed/',
+    'https://feeds.arstechnica.com/arstechnica/index/',
+    'https://www.technologyreview.com/feed/',
+    'https://www.artificialintelligence-news.com/feed/'
+]
+WORDS = 'phone chip cloud robot startup security research model update review'.split()
+
+def make_rows(n, seed=0):
+    """Row-like tuples of (title, summary, url, feed index)"""
+    rng = random.Random(seed)
+    titles = [' '.join(rng.choices(WORDS, k=4)) for _ in range(1000)]
+    summaries = [' '.join(rng.choices(WORDS, k=12)) for _ in range(1000)]
+    return [
+        (titles[i % 1000], summaries[(i * 7) % 1000], f'https://example.com/{i}', i % 4)
+        for i in range(n)
+    ]
+
+def fresh_source(feed):
+    """A new copy of the feed URL, as each row read from SQLite or a feed has"""
+    return ''.join([FEEDS[feed][:8], FEEDS[feed][8:]])
+
+# The builders create each article's source string inside the traced region,
+# so the dict figure pays for a copy per article and the record figure shows
+# what interning saves.
+def build_dicts(rows):
+    return [
+        {'title': title, 'content': '', 'summary': summary, 'url': url, 'source': fresh_source(feed),
+         'topic_group': '', 'published_date': '', 'processed_date': None}
+        for title, summary, url, feed in rows
+    ]
+
+def build_records(rows):
+    return [
+        ArticleRecord(title=title, summary=summary, url=url, source=fresh_source(feed))
+        for title, summary, url, feed in rows
+    ]
+
+def group_dicts(articles, topic_groups=TOPIC_GROUPS):
+    """The previous grouping: per-field lowercasing and copied per-topic lists"""
+    groups = {topic: [] for topic in topic_groups}
+    for article in articles:
+        title_lower = article['title'].lower()
+        content_lower = article.get('content', '').lower()
+        summary_lower = article.get('summary', '').lower()
+        for topic, keywords in topic_groups.items():
+            if topic != 'Tech' and keywords and any(
+                    keyword in title_lower or keyword in content_lower or keyword in summary_lower
+                    for keyword in keywords):
+                groups[topic].append(article)
+                break
+        else:
+            groups['Tech'].append(article)
+    return {topic: {'count': len(items), 'articles': list(items)} for topic, items in groups.items()}
+
+def measure(build, rows):
+    gc.collect()
+    tracemalloc.start()
+    articles = build(rows)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return articles, size
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--articles', type=int, default=1000000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.articles)
+
+    dicts, dict_bytes = measure(build_dicts, rows)
+    dict_group_seconds = timed(group_dicts, dicts)
+    del dicts
+
+    records, record_bytes = measure(build_records, rows)
+    record_group_seconds = timed(group_indices_by_topic, records)
+
+    print(json.dumps({
+        'articles': args.articles,
+        'bytes_per_article': {'dict': round(dict_bytes / args.articles, 1),
+                              'record': round(record_bytes / args.articles, 1)},
+        'grouping_seconds': {'dict': round(dict_group_seconds, 3),
+                             'record': round(record_group_seconds, 3)},
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
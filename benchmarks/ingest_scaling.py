@@ -0,0 +1,63 @@
+# benchmarks/ingest_scaling.py
+"""Scaling curve for multi-process ingestion over synthetic local feeds.
+
+Usage: python -m benchmarks.ingest_scaling [--feeds 32] [--entries 200] [--max-workers N]
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+
+from app.core.ingest import parallel_ingest
+from app.database.models import Database
+
+PARAGRAPH = (
+    '<p>Researchers announced a <b>breakthrough</b> in <a href="#">machine learning</a> '
+    'hardware, while a startup closed new funding to tackle data privacy.</p>'
+)
+
+def write_feed(path, feed_idx, entries):
+    """Write an RSS file whose entries carry HTML-heavy summaries"""
+    items = []
+    for i in range(entries):
+        body = PARAGRAPH * 20
+        items.append(
+            f'<item><title>Story {feed_idx}-{i}</title>'
+            f'<link>https://example.com/{feed_idx}/{i}</link>'
+            f'<description><![CDATA[{body}]]></description>'
+            f'<pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate></item>'
+        )
+    with open(path, 'w') as f:
+        f.write('<?xml version="1.0"?><rss version="2.0"><channel><title>Bench</title>')
+        f.write(''.join(items))
+        f.write('</channel></rss>')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--feeds', type=int, default=32)
+    parser.add_argument('--entries', type=int, default=200)
+    parser.add_argument('--max-workers', type=int, default=multiprocessing.cpu_count())
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        feeds = []
+        for idx in range(args.feeds):
+            path = os.path.join(tmp, f'feed_{idx}.xml')
+            write_feed(path, idx, args.entries)
+            feeds.append(path)
+
+        worker_counts = sorted({1, *[2 ** i for i in range(1, 8) if 2 ** i <= args.max_workers], args.max_workers})
+        baseline = None
+
+        print(f"{'workers':>8} {'articles':>9} {'seconds':>8} {'art/s':>8} {'speedup':>8}")
+        for workers in worker_counts:
+            db = Database(os.path.join(tmp, f'bench_{workers}.db'))
+            stats = parallel_ingest(db, feeds, workers=workers,
+                                    articles_per_feed=args.entries)
+            baseline = baseline or stats['elapsed']
+            rate = stats['articles'] / stats['elapsed']
+            print(f"{workers:>8} {stats['articles']:>9} {stats['elapsed']:>8.2f} "
+                  f"{rate:>8.0f} {baseline / stats['elapsed']:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# benchmarks/reclassify.py
+"""Incremental vs full reclassification of a synthetic archive after a one-keyword change.
+
+Usage: python -m benchmarks.reclassify [--rows 1000000]
+"""
+import argparse
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from app.core.processor import TOPIC_GROUPS, classify_text
+from app.core.reclassifier import Reclassifier
+from app.database.models import Database
+
+# Mostly neutral vocabulary so a sizeable share of the archive lands in 'Tech'
+WORDS = ('robotics chip cloud gadget review phone battery screen laptop update '
+         'camera drone browser console robot app ' * 6 +
+         'startup funding security research openai model breach patent').split()
+
+def build_archive(db, rows, seed=0):
+    rng = random.Random(seed)
+    batch = []
+    with sqlite3.connect(db.db_name) as conn:
+        for i in range(rows):
+            title = ' '.join(rng.choices(WORDS, k=5))
+            content = ' '.join(rng.choices(WORDS, k=25))
+            summary = ' '.join(rng.choices(WORDS, k=12))
+            batch.append((title, content, summary, f'https://example.com/{i}', 'bench',
+                          classify_text(title, content, summary, TOPIC_GROUPS), '2024-01-01T00:00:00'))
+            if len(batch) == 50000:
+                conn.executemany('''
+                    INSERT INTO articles (title, content, summary, url, source, topic_group, processed_date)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', batch)
+                batch = []
+        conn.executemany('''
+            INSERT INTO articles (title, content, summary, url, source, topic_group, processed_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', batch)
+        conn.commit()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--keyword', default='robotics')
+    parser.add_argument('--topic', default='Innovation')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, 'bench.db'))
+        start = time.perf_counter()
+        build_archive(db, args.rows)
+        build_seconds = time.perf_counter() - start
+
+        reclassifier = Reclassifier(db)
+        reclassifier.sync(TOPIC_GROUPS)
+
+        changed = {topic: list(keywords) for topic, keywords in TOPIC_GROUPS.items()}
+        changed[args.topic].append(args.keyword)
+        incremental = reclassifier.sync(changed)
+
+        # Full pass for comparison; should find nothing left to update
+        full = reclassifier.reclassify(changed)
+
+        print(json.dumps({
+            'rows': args.rows,
+            'build_seconds': round(build_seconds, 2),
+            'change': f"+{args.keyword} in {args.topic}",
+            'incremental': {k: round(v, 3) if isinstance(v, float) else v for k, v in incremental.items()},
+            'full_scan': {k: round(v, 3) if isinstance(v, float) else v for k, v in full.items()},
+        }, indent=2))
+
+if __name__ == "__main__":
+    main()
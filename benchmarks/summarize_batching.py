@@ -0,0 +1,102 @@
+# benchmarks/summarize_batching.py
+"""Per-article vs micro-batched summarization against a local stub endpoint.
+
+The stub accepts a string or a list of strings as "inputs", sleeps a fixed
+per-request overhead plus a small per-item cost, and charges one unit per
+request. Batches containing the `reject` marker get a 422, like an input
+the real endpoint cannot process; setting `outage` to a status code (e.g.
+503) fails every request with it.
+
+Usage: python -m benchmarks.summarize_batching [--articles 64] [--overhead 0.2]
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+os.environ.setdefault('HUGGINGFACE_API_KEY', 'stub')
+
+from app.core.processor import ContentProcessor
+from app.core.records import ArticleRecord
+
+class StubEndpoint(ThreadingHTTPServer):
+    def __init__(self, overhead, per_item, reject=None):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.overhead = overhead
+        self.per_item = per_item
+        self.reject = reject
+        self.outage = None
+        self.charges = 0
+        self.lock = threading.Lock()
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        inputs = body['inputs']
+        texts = inputs if isinstance(inputs, list) else [inputs]
+
+        with self.server.lock:
+            self.server.charges += 1
+        time.sleep(self.server.overhead + self.server.per_item * len(texts))
+
+        if self.server.outage:
+            status, result = self.server.outage, {'error': 'service unavailable'}
+        elif self.server.reject and any(self.server.reject in text for text in texts):
+            status, result = 422, {'error': 'input could not be processed'}
+        else:
+            status, result = 200, [{'summary_text': text[:80]} for text in texts]
+
+        payload = json.dumps(result).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+def make_articles(n):
+    return [
+        ArticleRecord(title=f'Story {i}', content=f'<p>Short feed summary number {i} about a startup.</p>',
+                      url=f'https://example.com/{i}', source='stub')
+        for i in range(n)
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--articles', type=int, default=64)
+    parser.add_argument('--overhead', type=float, default=0.2)
+    parser.add_argument('--per-item', type=float, default=0.005)
+    args = parser.parse_args()
+
+    server = StubEndpoint(args.overhead, args.per_item)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    processor = ContentProcessor()
+    processor.summarization_url = url
+
+    # Baseline: one request per article
+    start = time.perf_counter()
+    for article in make_articles(args.articles):
+        processor.summarize_batch([article.content])
+    single = time.perf_counter() - start
+    single_charges, server.charges = server.charges, 0
+
+    start = time.perf_counter()
+    processed, failed = processor.process_batch(make_articles(args.articles))
+    batched = time.perf_counter() - start
+
+    print(json.dumps({
+        'articles': args.articles,
+        'per_article': {'seconds': round(single, 3), 'requests': single_charges},
+        'micro_batched': {'seconds': round(batched, 3), 'requests': server.charges,
+                          'failed': len(failed), 'final_batch_size': processor.batcher.batch_size},
+    }, indent=2))
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
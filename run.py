@@ -1,44 +1,60 @@
 # run.py
+import argparse
 import logging
 from app.core.aggregator import ContentAggregator
-from app.core.processor import ContentProcessor
+from app.core.ingest import parallel_ingest
+from app.core.processor import TOPIC_GROUPS, ContentProcessor
+from app.core.reclassifier import Reclassifier
+from app.core.resilience import RunBudget
+from app.core.scheduler import SummaryScheduler
 from app.database.models import Database
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Fetch, summarize and store today's tech news")
+    parser.add_argument('--workers', type=int, default=0,
+                        help='Shard feeds across N worker processes with a single SQLite writer (0 = in-process)')
+    parser.add_argument('--budget', type=float, default=None,
+                        help='Wall-clock budget for the run in seconds; inference falls back to degraded output once spent')
+    parser.add_argument('--max-jobs', type=int, default=50,
+                        help='Maximum number of queued articles to summarize this run (articles, not API requests)')
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+    budget = RunBudget(args.budget)
     try:
         # Initialize components
         aggregator = ContentAggregator()
-        processor = ContentProcessor()
         db = Database()
         
-        # Fetch and process articles
-        articles = aggregator.fetch_articles()
-        logger.info(f"Fetched {len(articles)} new articles")
+        # Bring stored topics in line with the current keyword taxonomy
+        Reclassifier(db).sync(TOPIC_GROUPS)
         
-        if not articles:
-            logger.info("No new articles to process")
-            return
+        scheduler = SummaryScheduler(db)
         
-        # Process articles
-        processed_articles = []
-        for article in articles:
-            processed_article, error = processor.process_article(article)
-            if error:
-                logger.error(f"Error processing article: {error}")
-                continue
-            processed_articles.append(processed_article)
+        # Fetch new articles and queue them for summarization
+        if args.workers:
+            stats = parallel_ingest(db, aggregator.feeds, workers=args.workers,
+                                    articles_per_feed=aggregator.articles_per_feed,
+                                    scheduler=scheduler)
+            logger.info(f"Parallel ingest queued {stats['articles']} articles in {stats['elapsed']:.2f}s")
+        else:
+            articles = aggregator.fetch_articles()
+            logger.info(f"Fetched {len(articles)} articles")
+            if articles:
+                scheduler.enqueue(articles)
         
-        # Group articles and save
-        grouped_articles = processor.group_articles_by_topic(processed_articles)
-        for topic, group_data in grouped_articles.items():
-            if group_data and group_data['articles']:
-                for article_dict in group_data['articles']:
-                    article_dict['topic_group'] = topic
-                    db.save_processed_article(article_dict)
+        # Summarize the most valuable queued articles, up to --max-jobs
+        processor = ContentProcessor(db)
+        processor.budget = budget
+        scheduler.drain(processor, args.max_jobs)
+        logger.info(f"Summary jobs by status: {db.count_summary_jobs()}")
         
+        for name, breaker in processor.breakers.items():
+            logger.info(f"Circuit breaker '{name}' ended {breaker.state} after {len(breaker.transitions)} transitions")
         logger.info("Processing completed")
         
     except Exception as e:
@@ -0,0 +1,133 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from app.core.batching import MicroBatcher
+from app.core.processor import ContentProcessor, is_rejected_input
+from benchmarks.summarize_batching import StubEndpoint, make_articles
+
+@pytest.fixture
+def stub():
+    server = StubEndpoint(overhead=0.02, per_item=0.001, reject='POISON')
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.url = f'http://127.0.0.1:{server.server_address[1]}'
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def stub_backend(url):
+    def backend(texts):
+        response = requests.post(url, json={'inputs': texts}, timeout=5)
+        response.raise_for_status()
+        return [item['summary_text'] for item in response.json()]
+    return backend
+
+def test_full_batches_go_out_in_one_request_each(stub):
+    batcher = MicroBatcher(stub_backend(stub.url), max_batch_size=4, max_wait=1.0)
+
+    futures = batcher.map([f'text {i}' for i in range(8)])
+
+    assert [future.result(timeout=5) for future in futures] == [f'text {i}' for i in range(8)]
+    assert stub.charges == 2
+    assert batcher.stats['items'] == 8
+
+def test_partial_batch_is_flushed_at_the_deadline(stub):
+    batcher = MicroBatcher(stub_backend(stub.url), max_batch_size=16, max_wait=0.1)
+
+    start = time.monotonic()
+    futures = batcher.map(['a', 'b'])
+
+    assert [future.result(timeout=5) for future in futures] == ['a', 'b']
+    assert time.monotonic() - start < 1.0
+    assert stub.charges == 1
+
+def test_results_are_scattered_back_to_their_callers(stub):
+    batcher = MicroBatcher(stub_backend(stub.url), max_batch_size=8, max_wait=0.05)
+    results = {}
+
+    def caller(idx):
+        results[idx] = batcher.submit(f'caller {idx}').result(timeout=5)
+
+    threads = [threading.Thread(target=caller, args=(idx,)) for idx in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {idx: f'caller {idx}' for idx in range(20)}
+    assert stub.charges < 20
+
+def test_batch_size_grows_while_fast(stub):
+    batcher = MicroBatcher(stub_backend(stub.url), max_batch_size=16, max_wait=1.0, target_latency=2.0)
+
+    for future in batcher.map([str(i) for i in range(4)]):
+        future.result(timeout=5)
+
+    assert batcher.batch_size == 5
+
+def test_batch_size_halves_when_slow(stub):
+    stub.overhead = 0.2
+    batcher = MicroBatcher(stub_backend(stub.url), max_batch_size=16, max_wait=1.0, target_latency=0.1)
+
+    for future in batcher.map([str(i) for i in range(4)]):
+        future.result(timeout=5)
+
+    assert batcher.batch_size == 2
+
+def test_bad_input_fails_only_its_own_future(stub):
+    batcher = MicroBatcher(stub_backend(stub.url), max_batch_size=8, max_wait=1.0,
+                           split=is_rejected_input)
+    texts = [f'text {i}' for i in range(8)]
+    texts[5] = 'POISON'
+
+    futures = batcher.map(texts)
+
+    for idx, future in enumerate(futures):
+        if idx == 5:
+            with pytest.raises(requests.HTTPError):
+                future.result(timeout=5)
+        else:
+            assert future.result(timeout=5) == texts[idx]
+    # [0-3] ok, [4-7] fails, then [4, 5] fails, [6, 7], [4] and [5]
+    assert stub.charges == 6
+    assert batcher.batch_size == 5
+
+def test_process_batch_isolates_bad_input_without_tripping_breaker(stub):
+    processor = ContentProcessor()
+    processor.summarization_url = stub.url
+    articles = make_articles(8)
+    articles[2].content = '<p>POISON</p>'
+
+    processed, failed = processor.process_batch(articles)
+
+    assert len(processed) == 7
+    assert [article.url for article, _ in failed] == [articles[2].url]
+    assert not any(article.degraded for article in processed)
+    assert processor.breakers['summarization'].state == 'closed'
+
+def test_endpoint_errors_fail_the_whole_batch_without_splitting(stub):
+    stub.outage = 503
+    batcher = MicroBatcher(stub_backend(stub.url), max_batch_size=4, max_wait=1.0,
+                           split=is_rejected_input)
+
+    futures = batcher.map([str(i) for i in range(4)])
+
+    for future in futures:
+        with pytest.raises(requests.HTTPError):
+            future.result(timeout=5)
+    assert stub.charges == 1
+
+def test_outage_defers_every_article_instead_of_failing_them(stub, caplog):
+    stub.outage = 503
+    processor = ContentProcessor()
+    processor.summarization_url = stub.url
+
+    processed, failed = processor.process_batch(make_articles(40))
+
+    assert not failed
+    assert len(processed) == 40 and all(article.degraded for article in processed)
+    assert processor.breakers['summarization'].state == 'open'
+    assert stub.charges <= 3
+    assert sum('Batch of 1 failed' in message for message in caplog.messages) <= 1
@@ -0,0 +1,68 @@
+import sqlite3
+
+import pytest
+
+from app.database.models import Database
+
+DAY = '2024-03-05'
+
+def insert(db, rows):
+    """rows: (url, topic_group, source, processed_date)"""
+    with sqlite3.connect(db.db_name) as conn:
+        conn.executemany('''
+            INSERT INTO articles (title, content, summary, url, source, topic_group, processed_date)
+            VALUES (?, '', '', ?, ?, ?, ?)
+        ''', [(f'Title {url}', url, source, topic, date) for url, topic, source, date in rows])
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / 'digest.db'))
+    rows = [(f'ai-{i}', 'AI_ML', f'feed-{i % 2}', f'{DAY}T{10 + i // 3:02d}:00:00') for i in range(9)]
+    rows += [
+        ('biz', 'Business', 'feed-0', f'{DAY}T09:00:00'),
+        ('yesterday', 'AI_ML', 'feed-0', '2024-03-04T23:59:59'),
+        ('tomorrow', 'AI_ML', 'feed-0', '2024-03-06T00:00:00'),
+        ('untagged', '', 'feed-2', f'{DAY}T08:00:00'),
+    ]
+    insert(db, rows)
+    return db
+
+def test_topic_source_counts_cover_only_the_day(db):
+    counts = sorted(db.get_topic_source_counts(DAY))
+
+    assert counts == [('', 'feed-2', 1), ('AI_ML', 'feed-0', 5), ('AI_ML', 'feed-1', 4),
+                      ('Business', 'feed-0', 1)]
+
+def test_pages_are_newest_first_and_cover_every_row_once(db):
+    seen, after = [], None
+    while True:
+        page = db.get_articles_page(DAY, 'AI_ML', after, limit=4)
+        if not page:
+            break
+        seen += page
+        after = (page[-1]['processed_date'], page[-1]['id'])
+
+    assert len(seen) == 9
+    assert len({row['url'] for row in seen}) == 9
+    keys = [(row['processed_date'], row['id']) for row in seen]
+    assert keys == sorted(keys, reverse=True)
+
+def test_keyset_breaks_ties_on_id(db):
+    first = db.get_articles_page(DAY, 'AI_ML', limit=2)
+    # Three rows share each processed_date, so the cursor lands mid-timestamp
+    assert first[0]['processed_date'] == first[1]['processed_date']
+
+    second = db.get_articles_page(DAY, 'AI_ML', (first[-1]['processed_date'], first[-1]['id']), limit=2)
+
+    assert second[0]['processed_date'] == first[-1]['processed_date']
+    assert second[0]['id'] < first[-1]['id']
+    assert {row['url'] for row in first}.isdisjoint(row['url'] for row in second)
+
+def test_pages_use_the_topic_date_index(db):
+    with sqlite3.connect(db.db_name) as conn:
+        plan = conn.execute('''
+            EXPLAIN QUERY PLAN SELECT id FROM articles
+            WHERE topic_group = ? AND processed_date >= ? AND processed_date < ?
+            ORDER BY processed_date DESC, id DESC LIMIT 20
+        ''', ('AI_ML', DAY, '2024-03-06')).fetchall()
+    assert any('idx_articles_topic_date' in row[-1] for row in plan)
@@ -0,0 +1,122 @@
+import json
+import math
+import random
+import sqlite3
+import statistics
+
+import pytest
+
+from app.core.evaluation import RunningStats, evaluate_grouping, evaluate_summaries, main, rouge_n
+from app.database.models import Database
+
+def write_fixture(path, items):
+    with open(path, 'w') as f:
+        for item in items:
+            f.write(json.dumps(item) + '\n')
+    return str(path)
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / 'eval.db'))
+    db.save_processed_articles([
+        {'title': 'One', 'content': '<p>First sentence. Second sentence. Third sentence. Fourth one.</p>',
+         'summary': 'First sentence. Second sentence. Third sentence.', 'url': 'a', 'topic_group': 'Tech'},
+        {'title': 'Two', 'content': '<p>Alpha beta gamma. Delta epsilon.</p>',
+         'summary': 'Something else entirely', 'url': 'b', 'topic_group': 'Business'},
+        {'title': 'Three', 'content': '', 'summary': 'Orphan summary', 'url': 'c', 'topic_group': 'Tech'},
+        {'title': 'Four', 'content': '<p>Pending.</p>', 'summary': '', 'url': 'd', 'topic_group': ''},
+    ])
+    return db
+
+def test_running_stats_match_exact_values():
+    rng = random.Random(3)
+    values = [rng.random() for _ in range(5000)]
+    stats = RunningStats(bins=1000)
+    for value in values:
+        stats.add(value)
+
+    assert stats.mean == pytest.approx(statistics.fmean(values))
+    assert math.sqrt(stats._m2 / stats.count) == pytest.approx(statistics.pstdev(values))
+    assert (stats.min, stats.max) == (min(values), max(values))
+    assert stats.percentile(50) == pytest.approx(statistics.median(values), abs=0.01)
+    assert stats.percentile(90) == pytest.approx(sorted(values)[4499], abs=0.01)
+
+def test_percentile_is_the_upper_edge_of_the_sample_bin():
+    stats = RunningStats()
+    for value in [0.0] * 49 + [0.985] * 51:
+        stats.add(value)
+
+    # 0.985 falls inside [0.98, 0.99); its upper edge is capped at the max
+    assert stats.percentile(50) == 0.985
+    assert stats.percentile(40) == 0.01
+
+    stats = RunningStats()
+    for value in (0.123, 0.5, 0.5):
+        stats.add(value)
+    assert stats.percentile(30) == pytest.approx(0.13)
+    assert stats.percentile(30) >= 0.123
+
+def test_running_stats_percentiles_stay_within_observed_range():
+    stats = RunningStats(upper=2.0)
+    for value in (0.31, 0.32, 0.33, 5.0):
+        stats.add(value)
+
+    assert 0.31 <= stats.percentile(50) <= 5.0
+    assert stats.percentile(100) == 5.0
+    assert RunningStats().report() == {'count': 0}
+
+def test_rouge_n():
+    assert rouge_n('the cat sat', 'the cat sat') == 1.0
+    assert rouge_n('the cat sat', 'a dog ran') == 0.0
+    # 2 of 3 unigrams overlap on both sides
+    assert rouge_n('the cat sat', 'The cat ran') == pytest.approx(2 / 3)
+    # only "the cat" overlaps among bigrams
+    assert rouge_n('the cat sat', 'the cat ran', n=2) == pytest.approx(0.5)
+    assert rouge_n('', 'anything') == 0.0
+
+def test_evaluate_summaries_streams_every_summarized_row(db):
+    report = evaluate_summaries(db.db_name, chunk_size=1)
+
+    assert report['articles'] == 2
+    assert report['skipped_empty_content'] == 1
+    assert report['lead3_rouge1_f1']['max'] == 1.0
+    assert report['lead3_rouge1_f1']['min'] == 0.0
+    assert 0 < report['compression_ratio']['mean'] < 1
+
+def test_confusion_report(db, tmp_path):
+    fixture = write_fixture(tmp_path / 'labeled.jsonl', [
+        {'title': 'Startup raises funding', 'label': 'Business'},
+        {'title': 'Data breach at a bank', 'label': 'Cybersecurity'},
+        {'title': 'New phone reviewed', 'label': 'Tech'},
+        {'title': 'Startup patches a security hole', 'label': 'Cybersecurity'},
+    ])
+    topic_groups = {'Business': ['startup'], 'Cybersecurity': ['breach', 'security'], 'Tech': []}
+
+    report = evaluate_grouping(db.db_name, fixture, topic_groups)
+
+    fixture_report = report['fixture']
+    assert fixture_report['articles'] == 4
+    assert fixture_report['accuracy'] == 0.75
+    assert fixture_report['confusion']['Cybersecurity'] == {'Cybersecurity': 1, 'Business': 1}
+    assert fixture_report['per_topic']['Business'] == {
+        'support': 1, 'precision': 0.5, 'recall': 1.0, 'f1': 0.6667}
+    assert fixture_report['per_topic']['Cybersecurity']['recall'] == 0.5
+    assert report['archive_distribution'] == {'': 1, 'Business': 1, 'Tech': 2}
+
+def test_min_accuracy_gates_the_grouping_report(db, tmp_path, capsys):
+    fixture = write_fixture(tmp_path / 'labeled.jsonl', [{'title': 'Anything', 'label': 'Tech'}])
+
+    assert main(['grouping', '--db', db.db_name, '--fixture', fixture, '--min-accuracy', '0.9']) == 0
+    assert json.loads(capsys.readouterr().out)['fixture']['accuracy'] == 1.0
+
+    fixture = write_fixture(tmp_path / 'wrong.jsonl', [{'title': 'Anything', 'label': 'Business'}])
+    assert main(['grouping', '--db', db.db_name, '--fixture', fixture, '--min-accuracy', '0.9']) == 1
+
+def test_min_accuracy_is_rejected_for_summaries(db, capsys):
+    assert main(['summaries', '--db', db.db_name]) == 0
+    capsys.readouterr()
+
+    with pytest.raises(SystemExit) as exc:
+        main(['summaries', '--db', db.db_name, '--min-accuracy', '0.5'])
+    assert exc.value.code == 2
+    assert 'only applies to the grouping report' in capsys.readouterr().err
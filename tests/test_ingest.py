@@ -0,0 +1,80 @@
+import os
+import sqlite3
+
+import pytest
+
+from app.core.aggregator import ContentAggregator
+from app.core.ingest import parallel_ingest, shard_feeds
+from app.core.scheduler import SummaryScheduler
+from app.database.models import Database
+from benchmarks.ingest_scaling import write_feed
+
+class FailingDatabase(Database):
+    def enqueue_articles(self, articles):
+        raise sqlite3.OperationalError("disk I/O error")
+
+class CrashingDatabase(Database):
+    def enqueue_articles(self, articles):
+        os._exit(3)
+
+@pytest.fixture
+def feeds(tmp_path):
+    paths = []
+    for idx in range(3):
+        path = tmp_path / f'feed_{idx}.xml'
+        write_feed(str(path), idx, 5)
+        paths.append(str(path))
+    return paths
+
+def test_shard_feeds_round_robin():
+    assert shard_feeds(['a', 'b', 'c', 'd', 'e'], 2) == [['a', 'c', 'e'], ['b', 'd']]
+
+def test_shard_feeds_drops_empty_shards():
+    assert shard_feeds(['a', 'b'], 4) == [['a'], ['b']]
+    assert shard_feeds([], 3) == []
+
+def test_parallel_ingest_queues_every_article(tmp_path, feeds):
+    db = Database(str(tmp_path / 'ingest.db'))
+
+    stats = parallel_ingest(db, feeds, workers=2, articles_per_feed=5, batch_size=4)
+
+    assert stats['articles'] == 15
+    assert stats['workers'] == 2
+    with sqlite3.connect(db.db_name) as conn:
+        rows = conn.execute('SELECT summary, topic_group FROM articles').fetchall()
+    assert len(rows) == 15
+    assert all(topic and not summary for summary, topic in rows)
+    assert db.count_summary_jobs() == {'pending': 15}
+
+def stored_articles(db):
+    with sqlite3.connect(db.db_name) as conn:
+        return conn.execute('SELECT url, content, topic_group FROM articles ORDER BY url').fetchall()
+
+def test_parallel_and_in_process_paths_store_the_same_rows(tmp_path, feeds):
+    in_process = Database(str(tmp_path / 'in_process.db'))
+    aggregator = ContentAggregator()
+    aggregator.articles_per_feed = 5
+    for feed in feeds:
+        SummaryScheduler(in_process).enqueue(aggregator.fetch_feed(feed))
+
+    parallel = Database(str(tmp_path / 'parallel.db'))
+    parallel_ingest(parallel, feeds, workers=2, articles_per_feed=5)
+
+    rows = stored_articles(parallel)
+    assert len(rows) == 15
+    assert rows == stored_articles(in_process)
+    assert all(content.startswith('<p>') for _, content, _ in rows)
+
+def test_parallel_ingest_raises_when_writer_fails(tmp_path, feeds):
+    db = FailingDatabase(str(tmp_path / 'failing.db'))
+
+    with pytest.raises(RuntimeError, match='disk I/O error'):
+        parallel_ingest(db, feeds * 20, workers=2, articles_per_feed=5,
+                        batch_size=2, flush_interval=0.2)
+
+def test_parallel_ingest_raises_when_writer_dies(tmp_path, feeds):
+    db = CrashingDatabase(str(tmp_path / 'crashing.db'))
+
+    with pytest.raises(RuntimeError, match='exited unexpectedly'):
+        parallel_ingest(db, feeds * 20, workers=2, articles_per_feed=5,
+                        batch_size=2, flush_interval=0.2)
@@ -0,0 +1,90 @@
+import random
+import sqlite3
+
+import pytest
+
+from app.core.processor import TOPIC_GROUPS, classify_text
+from app.core.reclassifier import Reclassifier, affected_filter, taxonomy_fingerprint
+from app.database.models import Database
+from benchmarks.reclassify import WORDS, build_archive
+
+def copy_groups(groups=TOPIC_GROUPS):
+    return {topic: list(keywords) for topic, keywords in groups.items()}
+
+def stored_topics(db):
+    with sqlite3.connect(db.db_name) as conn:
+        return dict(conn.execute('SELECT id, topic_group FROM articles').fetchall())
+
+def expected_topics(db, topic_groups):
+    with sqlite3.connect(db.db_name) as conn:
+        rows = conn.execute('SELECT id, title, content, summary FROM articles').fetchall()
+    return {row[0]: classify_text(row[1], row[2], row[3], topic_groups) for row in rows}
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / 'archive.db'))
+    build_archive(db, 2000)
+    return db
+
+def test_affected_filter_without_changes_selects_nothing():
+    assert affected_filter(TOPIC_GROUPS, copy_groups()) == ('0', [])
+
+def test_affected_filter_reorder_selects_everything():
+    reordered = dict(reversed(list(copy_groups().items())))
+    assert affected_filter(TOPIC_GROUPS, reordered) == ('1', [])
+
+def test_affected_filter_escapes_like_wildcards():
+    groups = copy_groups()
+    groups['Business'].append('100%_off')
+    _, params = affected_filter(TOPIC_GROUPS, groups)
+    assert '%100!%!_off%' in params
+
+def test_sync_records_initial_taxonomy_without_reclassifying(db):
+    stats = Reclassifier(db).sync(TOPIC_GROUPS)
+    assert stats['version'] == 1
+    assert stats['candidates'] == 0
+
+def test_sync_is_a_noop_for_an_unchanged_taxonomy(db):
+    reclassifier = Reclassifier(db)
+    reclassifier.sync(TOPIC_GROUPS)
+    assert reclassifier.sync(copy_groups()) == {'version': 1, 'candidates': 0, 'updated': 0, 'elapsed': 0.0}
+
+def test_incremental_sync_matches_full_rescan_for_random_keyword_edits(db):
+    rng = random.Random(1)
+    reclassifier = Reclassifier(db, chunk_size=300)
+    groups = copy_groups()
+    reclassifier.sync(groups)
+
+    for _ in range(10):
+        groups = copy_groups(groups)
+        topic = rng.choice([t for t in groups if t != 'Tech'])
+        if groups[topic] and rng.random() < 0.5:
+            groups[topic].remove(rng.choice(groups[topic]))
+        else:
+            groups[topic].append(rng.choice(WORDS))
+        stats = reclassifier.sync(groups)
+
+        assert stats['candidates'] < 2000
+        assert stored_topics(db) == expected_topics(db, groups)
+
+def test_interrupted_reclassification_resumes_on_next_sync(db, monkeypatch):
+    reclassifier = Reclassifier(db, chunk_size=50)
+    reclassifier.sync(TOPIC_GROUPS)
+    groups = copy_groups()
+    groups['Innovation'].append('robotics')
+
+    original = reclassifier.reclassify
+
+    def failing_reclassify(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(reclassifier, 'reclassify', failing_reclassify)
+    with pytest.raises(sqlite3.OperationalError):
+        reclassifier.sync(groups)
+    assert reclassifier.current_taxonomy()[1] == taxonomy_fingerprint(TOPIC_GROUPS)
+
+    monkeypatch.setattr(reclassifier, 'reclassify', original)
+    stats = reclassifier.sync(groups)
+    assert stats['version'] == 2
+    assert stats['updated'] > 0
+    assert stored_topics(db) == expected_topics(db, groups)
@@ -0,0 +1,58 @@
+import pickle
+
+import pytest
+
+from app.core.processor import group_indices_by_topic
+from app.core.records import ArticleRecord
+
+def fresh(text):
+    """An equal string that is not the same object, as read from SQLite or a pickle"""
+    return ''.join(list(text))
+
+def test_from_dict_ignores_unknown_and_null_keys():
+    record = ArticleRecord.from_dict({'title': 'T', 'url': 'u', 'id': 7, 'priority': 0.5, 'summary': None})
+
+    assert record.url == 'u'
+    assert record.summary == ''
+    assert not hasattr(record, 'id')
+
+def test_to_dict_round_trips():
+    record = ArticleRecord(title='T', content='c', url='u', source='s', topic_group='Tech',
+                           weight=1.5, attempts=2, degraded=True)
+
+    assert ArticleRecord.from_dict(record.to_dict()).to_dict() == record.to_dict()
+
+def test_records_have_no_instance_dict():
+    with pytest.raises(AttributeError):
+        ArticleRecord(title='T').extra = 1
+
+def test_source_and_topic_are_shared_between_records():
+    first = ArticleRecord(title='a', source=fresh('https://example.com/feed'), topic_group=fresh('AI_ML'))
+    second = ArticleRecord(title='b', source=fresh('https://example.com/feed'), topic_group=fresh('AI_ML'))
+
+    assert first.source is second.source
+    assert first.topic_group is second.topic_group
+
+def test_unpickled_records_are_interned_again():
+    source = 'https://example.com/' + 'pickled-feed'
+    record = ArticleRecord(title='T', url='u', source=source, topic_group='Business', degraded=True)
+
+    restored = pickle.loads(pickle.dumps(record))
+
+    assert restored.to_dict() == record.to_dict()
+    assert restored.source is ArticleRecord(title='x', source=fresh(source)).source
+    assert restored.topic_group is record.topic_group
+
+def test_group_indices_by_topic_returns_positions():
+    articles = [
+        ArticleRecord(title='Startup raises funding'),
+        ArticleRecord(title='New phone reviewed'),
+        ArticleRecord(title='Data breach at a bank'),
+        ArticleRecord(title='Another startup'),
+    ]
+    topic_groups = {'Business': ['startup'], 'Cybersecurity': ['breach'], 'Tech': []}
+
+    groups = group_indices_by_topic(articles, topic_groups)
+
+    assert groups == {'Business': [0, 3], 'Cybersecurity': [2], 'Tech': [1]}
+    assert [articles[i].title for i in groups['Business']] == ['Startup raises funding', 'Another startup']
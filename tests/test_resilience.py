@@ -0,0 +1,169 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from app.core.processor import ContentProcessor
+from app.core.records import ArticleRecord
+from app.core.resilience import BudgetExhausted, CircuitBreaker, CircuitBreakerOpen, RunBudget
+from app.database.models import Database
+from benchmarks.summarize_batching import StubEndpoint, make_articles
+
+@pytest.fixture
+def stub():
+    server = StubEndpoint(overhead=0.0, per_item=0.0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.url = f'http://127.0.0.1:{server.server_address[1]}'
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def processor(stub):
+    processor = ContentProcessor()
+    processor.summarization_url = stub.url
+    processor.gemma_url = stub.url
+    return processor
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker('test', failure_threshold=3)
+    seen = []
+    breaker.listeners.append(lambda name, old, new: seen.append((name, old, new)))
+
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == 'closed'
+    breaker.record_success(0.1)
+    breaker.record_failure()
+    assert breaker.state == 'closed'
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert breaker.is_open()
+    assert not breaker.allow_request()
+    assert seen == [('test', 'closed', 'open')]
+
+def test_slow_calls_count_as_failures():
+    breaker = CircuitBreaker('test', failure_threshold=2, latency_slo=1.0)
+    breaker.record_success(5.0)
+    breaker.record_success(5.0)
+    assert breaker.state == 'open'
+
+def test_half_open_lets_a_single_probe_through():
+    breaker = CircuitBreaker('test', failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    assert not breaker.allow_request()
+
+    time.sleep(0.06)
+    assert not breaker.is_open()
+    assert breaker.allow_request()
+    assert breaker.state == 'half_open'
+    assert not breaker.allow_request()
+
+    breaker.record_success(0.1)
+    assert breaker.state == 'closed'
+    assert [(old, new) for _, old, new in breaker.transitions] == [
+        ('closed', 'open'), ('open', 'half_open'), ('half_open', 'closed')]
+
+def test_failed_probe_reopens_and_release_frees_the_probe():
+    breaker = CircuitBreaker('test', failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.release()
+    assert breaker.state == 'half_open'
+    assert breaker.allow_request()
+
+def test_unbounded_budget():
+    budget = RunBudget()
+    assert budget.remaining() is None
+    assert not budget.expired()
+    assert budget.timeout(60) == 60
+
+def test_budget_caps_timeouts_and_expires():
+    budget = RunBudget(0.2)
+    assert 0.1 <= budget.timeout(60) <= 0.2
+    assert budget.timeout(0.05) == 0.1
+    time.sleep(0.25)
+    assert budget.expired()
+    assert budget.remaining() == 0.0
+
+def test_spent_budget_sends_no_request(processor, stub):
+    processor.budget = RunBudget(0)
+
+    with pytest.raises(BudgetExhausted):
+        processor.summarize_batch(['text'])
+
+    article, error = processor.process_article(make_articles(1)[0])
+    assert error is None and article.degraded
+    assert stub.charges == 0
+    assert processor.breakers['summarization'].consecutive_failures == 0
+
+def test_budget_timeout_does_not_trip_the_breaker(processor, stub):
+    stub.overhead = 1.0
+    processor.budget = RunBudget(0.3)
+
+    with pytest.raises(BudgetExhausted):
+        processor.summarize_batch(['text'])
+
+    breaker = processor.breakers['summarization']
+    assert breaker.consecutive_failures == 0
+    assert breaker.state == 'closed'
+
+def test_endpoint_timeout_still_trips_the_breaker(processor, monkeypatch):
+    def timeout(*args, **kwargs):
+        raise requests.Timeout("read timed out")
+    monkeypatch.setattr(requests, 'post', timeout)
+
+    with pytest.raises(requests.Timeout):
+        processor.summarize_batch(['text'])
+    assert processor.breakers['summarization'].consecutive_failures == 1
+
+def test_open_breaker_degrades_without_calling(processor, stub):
+    processor.breakers['summarization'].failure_threshold = 1
+    processor.breakers['summarization'].record_failure()
+
+    with pytest.raises(CircuitBreakerOpen):
+        processor.summarize_batch(['text'])
+    processed, failed = processor.process_batch(make_articles(3))
+    assert not failed and all(article.degraded for article in processed)
+    assert stub.charges == 0
+
+def test_insights_survive_a_restart(tmp_path, monkeypatch):
+    db = Database(str(tmp_path / 'insights.db'))
+    insight = 'Startups are shipping smaller models to run on phones'
+
+    class Response:
+        status_code = 200
+        text = ''
+        def json(self):
+            return [{'generated_text': insight}]
+    monkeypatch.setattr(requests, 'post', lambda *args, **kwargs: Response())
+
+    articles = [ArticleRecord(title='Story', summary='A summary', url='u', source='s')]
+    assert ContentProcessor(db).get_insights(articles, 'Business') == [insight]
+
+    restarted = ContentProcessor(db)
+    restarted.budget = RunBudget(0)
+    assert restarted.get_insights(articles, 'Business') == [insight]
+    assert restarted.get_insights(articles, 'Innovation') != [insight]
+
+@pytest.mark.parametrize('status, failures', [(400, 0), (422, 0), (429, 1), (503, 1)])
+def test_insights_breaker_counts_only_endpoint_failures(status, failures, monkeypatch):
+    class Response:
+        status_code = status
+        text = 'error'
+    monkeypatch.setattr(requests, 'post', lambda *args, **kwargs: Response())
+    processor = ContentProcessor()
+
+    insights = processor.get_insights([ArticleRecord(title='Story', url='u')], 'Business')
+
+    assert len(insights) == 3
+    assert processor.breakers['insights'].consecutive_failures == failures
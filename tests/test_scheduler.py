@@ -0,0 +1,155 @@
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.records import ArticleRecord
+from app.core.scheduler import SummaryScheduler
+from app.database.models import Database
+
+class FakeProcessor:
+    """Summarizes every job, or degrades/fails the URLs it is told to"""
+
+    def __init__(self, degrade=(), fail=()):
+        self.degrade = set(degrade)
+        self.fail = set(fail)
+        self.seen = []
+
+    def process_batch(self, articles):
+        self.seen.extend(article.url for article in articles)
+        processed, failed = [], []
+        for article in articles:
+            if not article.content:
+                failed.append((article, "No content to process"))
+                continue
+            if article.url in self.fail:
+                failed.append((article, "endpoint error"))
+                continue
+            article.summary = f"summary of {article.title}"
+            article.degraded = article.url in self.degrade
+            processed.append(article)
+        return processed, failed
+
+def rfc822(hours_ago):
+    published = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+    return published.strftime('%a, %d %b %Y %H:%M:%S +0000')
+
+def article(url, source='plain', title='Quarterly gadget roundup', hours_ago=0):
+    return ArticleRecord(title=title, content='<p>Some content</p>', url=url, source=source,
+                         published_date=rfc822(hours_ago))
+
+def job(db, url):
+    with sqlite3.connect(db.db_name) as conn:
+        conn.row_factory = sqlite3.Row
+        return dict(conn.execute('SELECT * FROM summary_jobs WHERE url = ?', (url,)).fetchone())
+
+@pytest.fixture
+def db(tmp_path):
+    return Database(str(tmp_path / 'queue.db'))
+
+@pytest.fixture
+def scheduler(db):
+    return SummaryScheduler(db, source_weights={'heavy': 2.0}, topic_weights={'Tech': 1.0},
+                            half_life_hours=12, max_attempts=2, retry_backoff=300)
+
+def test_enqueue_skips_stored_urls(scheduler):
+    assert scheduler.enqueue([article('a'), article('b')]) == 2
+    assert scheduler.enqueue([article('a'), article('c')]) == 1
+
+def test_jobs_are_ordered_by_decayed_weight(scheduler, db):
+    scheduler.enqueue([
+        article('old-heavy', source='heavy', hours_ago=36),     # 2.0 / 4
+        article('fresh-plain', hours_ago=0),                    # 1.0 / 1
+        article('recent-heavy', source='heavy', hours_ago=6),   # 2.0 / 1.5
+        article('stale-plain', hours_ago=24),                   # 1.0 / 3
+    ])
+
+    jobs = db.get_summary_jobs(10, 12 * 3600)
+
+    assert [row['url'] for row in jobs] == ['recent-heavy', 'fresh-plain', 'old-heavy', 'stale-plain']
+    assert jobs[2]['priority'] == pytest.approx(0.5, rel=1e-3)
+
+def test_drain_takes_the_highest_priority_jobs(scheduler):
+    scheduler.enqueue([article('old', hours_ago=48), article('new'), article('newer', source='heavy')])
+    processor = FakeProcessor()
+
+    scheduler.drain(processor, 2)
+
+    assert processor.seen == ['newer', 'new']
+
+def test_drain_counts_articles_not_requests(scheduler, db):
+    scheduler.enqueue([article(str(i)) for i in range(5)])
+
+    stats = scheduler.drain(FakeProcessor(), 3)
+
+    assert stats == {'summarized': 3, 'degraded': 0, 'failed': 0}
+    assert db.count_summary_jobs() == {'done': 3, 'pending': 2}
+
+def test_failed_jobs_back_off_then_give_up(scheduler, db):
+    scheduler.enqueue([article('flaky')])
+    processor = FakeProcessor(fail={'flaky'})
+
+    scheduler.drain(processor, 10)
+    first = job(db, 'flaky')
+    assert (first['status'], first['attempts']) == ('pending', 1)
+    assert datetime.fromisoformat(first['next_attempt_at']) > datetime.now() + timedelta(seconds=250)
+    assert scheduler.drain(processor, 10) == {'summarized': 0, 'degraded': 0, 'failed': 0}
+
+    with sqlite3.connect(db.db_name) as conn:
+        conn.execute("UPDATE summary_jobs SET next_attempt_at = '2000-01-01'")
+    scheduler.drain(processor, 10)
+    second = job(db, 'flaky')
+    assert (second['status'], second['attempts']) == ('failed', 2)
+    assert datetime.fromisoformat(second['next_attempt_at']) > datetime.now() + timedelta(seconds=550)
+
+def test_articles_without_content_fail_at_once(scheduler, db):
+    empty = article('empty')
+    empty.content = ''
+    scheduler.enqueue([empty])
+
+    assert scheduler.drain(FakeProcessor(), 10)['failed'] == 1
+
+    failed = job(db, 'empty')
+    assert (failed['status'], failed['attempts'], failed['last_error']) == ('failed', 1, 'No content to process')
+
+def test_degraded_summaries_stay_queued(scheduler, db):
+    scheduler.enqueue([article('slow')])
+
+    stats = scheduler.drain(FakeProcessor(degrade={'slow'}), 10)
+
+    assert stats['degraded'] == 1
+    degraded = job(db, 'slow')
+    assert (degraded['status'], degraded['last_error']) == ('pending', 'degraded')
+    assert datetime.fromisoformat(degraded['next_attempt_at']) > datetime.now()
+
+def test_summarizing_keeps_the_ingest_time(scheduler, db):
+    scheduler.enqueue([article('a')])
+    with sqlite3.connect(db.db_name) as conn:
+        enqueued_at = conn.execute('SELECT processed_date FROM articles').fetchone()[0]
+
+    time.sleep(0.01)
+    scheduler.drain(FakeProcessor(), 10)
+
+    with sqlite3.connect(db.db_name) as conn:
+        processed_date, summarized_date, summary = conn.execute(
+            'SELECT processed_date, summarized_date, summary FROM articles').fetchone()
+    assert processed_date == enqueued_at
+    assert summarized_date > processed_date
+    assert summary == 'summary of Quarterly gadget roundup'
+
+def test_summarized_date_is_added_to_existing_databases(tmp_path):
+    path = str(tmp_path / 'old.db')
+    with sqlite3.connect(path) as conn:
+        conn.execute('''
+            CREATE TABLE articles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, content TEXT, summary TEXT,
+                url TEXT UNIQUE, source TEXT, topic_group TEXT, processed_date TEXT
+            )
+        ''')
+
+    Database(path)
+
+    with sqlite3.connect(path) as conn:
+        columns = {row[1] for row in conn.execute('PRAGMA table_info(articles)')}
+    assert 'summarized_date' in columns
@@ -0,0 +1,37 @@
+import os
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from app.database.models import Database
+
+testing = pytest.importorskip('streamlit.testing.v1')
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app', 'streamlit_app.py')
+
+def test_articles_total_matches_the_topic_tabs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('HUGGINGFACE_API_KEY', 'stub')
+    db = Database()
+    now = datetime.now().isoformat()
+    with sqlite3.connect(db.db_name) as conn:
+        conn.executemany('''
+            INSERT INTO articles (title, content, summary, url, source, topic_group, processed_date)
+            VALUES (?, '', 'A summary', ?, ?, ?, ?)
+        ''', [
+            ('Known', 'a', 'feed-0', 'AI_ML', now),
+            ('Also known', 'b', 'feed-1', 'Tech', now),
+            ('Untagged', 'c', 'feed-2', '', now),
+            ('Missing', 'd', 'feed-3', None, now),
+            ('Retired topic', 'e', 'feed-4', 'Gadgets', now),
+        ])
+
+    app = testing.AppTest.from_file(APP, default_timeout=30)
+    app.run()
+
+    assert not app.exception
+    metrics = {metric.label: metric.value for metric in app.metric}
+    assert metrics['Articles'] == '2'
+    assert metrics['Sources'] == '2'
+    assert sum(int(option.rsplit('(', 1)[1].rstrip(')')) for option in app.radio[0].options) == 2